@@ -0,0 +1,30 @@
+"""
+JSON parsing shared by the core nodes.
+
+orjson is used when it is installed and the json module otherwise.
+"""
+
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Characters json.loads skips before a value, and the characters a value can start with
+JSON_WHITESPACE = " \t\n\r"
+JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+
+def loads(text: str) -> Any:
+    """Parse JSON with orjson when it is installed, falling back to the json module."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # The json module also accepts NaN and Infinity, and raises the
+            # error reported for input that really is invalid
+            pass
+    return json.loads(text)
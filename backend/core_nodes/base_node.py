@@ -9,6 +9,19 @@ class BaseNode:
     essential functionality for building workflows.
     """
 
+    # Subclasses that declare their own __slots__ get instances without a
+    # per-instance __dict__; subclasses that don't keep working as before
+    __slots__ = (
+        "id",
+        "name",
+        "category",
+        "description",
+        "inputs",
+        "outputs",
+        "ui_properties",
+        "__plugin_meta__"
+    )
+
     def __init__(self):
         """Initialize the node."""
         # Default attributes that can be overridden by subclasses
@@ -104,7 +117,25 @@ class BaseNode:
         """
         Get the metadata for this node.
 
-        This method should be overridden by subclasses.
+        Subclasses either override this method or implement _build_metadata,
+        in which case each instance builds its metadata on first use and
+        keeps it. Instances don't share the object, so changes made to one
+        instance's metadata don't affect other instances.
+
+        Returns:
+            The node metadata
+        """
+        try:
+            return self.__plugin_meta__
+        except AttributeError:
+            return type(self)._build_metadata()
+
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """
+        Build the metadata for this node class.
+
+        This method should be overridden by subclasses with static metadata.
 
         Returns:
             The node metadata
@@ -9,6 +9,8 @@ class Loop(BaseNode):
     This node can iterate over arrays and execute for each item.
     """
     
+    __slots__ = ()
+    
     def get_metadata(self) -> PluginMetadata:
         """Get the node metadata."""
         return PluginMetadata(
@@ -142,14 +144,24 @@ class Loop(BaseNode):
         """
         # Get input items
         items = inputs.get("items", [])
-        reset = inputs.get("reset", False)
         
+        # Lists are the common case; only other inputs need coercion
         if not isinstance(items, list):
-            # Try to convert to list if possible
-            try:
-                items = list(items)
-            except:
-                items = [items]
+            items = self._coerce_items(items)
+        
+        return self._iterate(items, config, inputs)
+    
+    def _coerce_items(self, items: Any) -> List[Any]:
+        """Convert a non-list input into a list of items."""
+        # Try to convert to list if possible
+        try:
+            return list(items)
+        except TypeError:
+            return [items]
+    
+    def _iterate(self, items: List[Any], config: Dict[str, Any], inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Produce the current iteration data for a list of items."""
+        reset = inputs.get("reset", False)
         
         # Get configuration
         start_index = max(0, int(config.get("start_index", 0)))
@@ -157,6 +169,11 @@ class Loop(BaseNode):
         step = max(1, int(config.get("step", 1)))
         auto_reset = config.get("auto_reset", True)
         
+        # The loop ends at the last item or after max_iterations steps, whichever comes first
+        end_index = len(items)
+        if max_iterations > 0:
+            end_index = min(end_index, start_index + max_iterations * step)
+        
         # Get current iteration from context or start new
         context = inputs.get("__context__", {})
         
@@ -167,7 +184,7 @@ class Loop(BaseNode):
             current_index = context.get("current_index", start_index)
         
         # Check if we've reached the end
-        if current_index >= len(items) or (max_iterations > 0 and current_index >= start_index + max_iterations * step):
+        if current_index >= end_index:
             # Loop has completed
             return {
                 "current_item": None,
@@ -184,7 +201,7 @@ class Loop(BaseNode):
         # Check if this is the first or last iteration
         is_first = current_index == start_index
         next_index = current_index + step
-        is_last = next_index >= len(items) or (max_iterations > 0 and next_index >= start_index + max_iterations * step)
+        is_last = next_index >= end_index
         
         # Update context for next iteration
         return {
@@ -9,6 +9,8 @@ class Switch(BaseNode):
     This node routes data based on a value matching different cases.
     """
     
+    __slots__ = ()
+    
     def get_metadata(self) -> PluginMetadata:
         """Get the node metadata."""
         return PluginMetadata(
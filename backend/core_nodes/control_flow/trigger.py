@@ -9,6 +9,8 @@ class Trigger(BaseNode):
     This node can trigger workflows based on various events like timers, webhooks, etc.
     """
     
+    __slots__ = ()
+    
     def get_metadata(self) -> PluginMetadata:
         """Get the node metadata."""
         return PluginMetadata(
@@ -13,6 +13,8 @@ class WhileLoop(BaseNode):
     Executes connected nodes while a condition is true.
     """
 
+    __slots__ = ()
+
     def get_metadata(self) -> PluginMetadata:
         """Get the node metadata."""
         return PluginMetadata(
@@ -155,30 +157,46 @@ class WhileLoop(BaseNode):
         results = []
         iteration_count = 0
 
+        # Skip the graph lookups when the loop body would never run
+        if not condition or max_iterations <= 0:
+            if collect_results and result_var_name:
+                workflow_context.variables.set(result_var_name, results)
+            return {
+                "completed": True,
+                "iteration_count": iteration_count,
+                "results": results,
+                "__context__": workflow_context
+            }
+
         # Get connected nodes (the loop body)
         body_node_ids = workflow_context.get_connected_nodes(self.id, "iteration")
 
         # Get the condition node
         condition_node_id = workflow_context.get_input_node(self.id, "condition")
 
+        # Bind the context methods once rather than looking them up per iteration
+        set_variable = workflow_context.variables.set
+        execute_node = workflow_context.execute_node
+
         # Execute the loop
         while condition and iteration_count < max_iterations:
             # Set variables for this iteration
-            workflow_context.variables.set(iteration_var_name, iteration_count)
-
-            # Execute body nodes
-            iteration_results = []
-            for node_id in body_node_ids:
-                node_result = workflow_context.execute_node(node_id)
-                if collect_results and node_result:
-                    iteration_results.append(node_result)
+            set_variable(iteration_var_name, iteration_count)
 
+            # Execute body nodes, keeping non-empty results only when collecting
             if collect_results:
-                results.append(iteration_results)
+                results.append([
+                    node_result
+                    for node_result in map(execute_node, body_node_ids)
+                    if node_result
+                ])
+            else:
+                for node_id in body_node_ids:
+                    execute_node(node_id)
 
             # Update condition
             if condition_node_id:
-                condition_result = workflow_context.execute_node(condition_node_id)
+                condition_result = execute_node(condition_node_id)
                 if condition_result:
                     condition = condition_result.get("value", False)
             else:
@@ -188,7 +206,7 @@ class WhileLoop(BaseNode):
 
         # Store results in a variable if configured
         if collect_results and result_var_name:
-            workflow_context.variables.set(result_var_name, results)
+            set_variable(result_var_name, results)
 
         return {
             "completed": True,
@@ -1,10 +1,14 @@
-# This file is required to make Python treat the directory as a package
+import importlib
 
-from .string_converter import StringConverter
-from .number_converter import NumberConverter
-from .boolean_converter import BooleanConverter
-from .array_converter import ArrayConverter
-from .object_converter import ObjectConverter
+# Converters are imported on first access so that using one converter
+# does not pay the import cost of the others
+_LAZY_IMPORTS = {
+    'StringConverter': 'string_converter',
+    'NumberConverter': 'number_converter',
+    'BooleanConverter': 'boolean_converter',
+    'ArrayConverter': 'array_converter',
+    'ObjectConverter': 'object_converter'
+}
 
 __all__ = [
     'StringConverter',
@@ -13,3 +17,19 @@ __all__ = [
     'ArrayConverter',
     'ObjectConverter'
 ]
+
+
+def __getattr__(name):
+    """Import a converter class on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,62 @@
+"""
+Converter Dispatch
+
+Helpers shared by the converter nodes.
+"""
+
+import functools
+from typing import Dict, Any, Callable
+
+
+# Longest string input whose conversion is memoized
+_MEMOIZE_MAX_LENGTH = 1024
+
+
+def get_converter(converters: Dict[type, Callable], input_value: Any, default: Callable) -> Callable:
+    """
+    Get the conversion function for a value.
+
+    Args:
+        converters: Conversion functions by input type, in order of precedence
+        input_value: The value to convert
+        default: The conversion function for values of no listed type
+
+    Returns:
+        The function for the value's exact type, else for the first listed
+        type it is an instance of, else the default
+    """
+    converter = converters.get(type(input_value))
+    if converter is None:
+        # Subclasses are resolved on every call rather than added to the
+        # table, so the table never grows
+        converter = next(
+            (func for base, func in converters.items() if isinstance(input_value, base)),
+            default
+        )
+    return converter
+
+
+def memoize_short_strings(func: Callable) -> Callable:
+    """
+    Memoize a string conversion for inputs up to _MEMOIZE_MAX_LENGTH characters.
+
+    Short strings tend to repeat across executions. Longer ones are
+    converted without the cache so they are not kept alive by it.
+
+    Args:
+        func: A conversion function taking the string as its first argument
+
+    Returns:
+        The memoized conversion function
+    """
+    cached = functools.lru_cache(maxsize=1024)(func)
+
+    @functools.wraps(func)
+    def wrapper(input_value: str, *args: Any) -> Any:
+        if len(input_value) <= _MEMOIZE_MAX_LENGTH:
+            return cached(input_value, *args)
+        return func(input_value, *args)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
@@ -4,17 +4,58 @@ Array Converter Node
 This node converts various data types to arrays.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from backend.core_nodes.base_node import BaseNode
+from backend.core_nodes.converters._dispatch import get_converter, memoize_short_strings
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 
+
+def _from_none(input_value: Any, delimiter: str) -> List[Any]:
+    return []
+
+
+def _from_sequence(input_value: Any, delimiter: str) -> List[Any]:
+    return list(input_value)
+
+
+@memoize_short_strings
+def _split_string(input_value: str, delimiter: str) -> Tuple[str, ...]:
+    # Split string by delimiter, stripping each item without a Python-level loop
+    return tuple(map(str.strip, input_value.split(delimiter)))
+
+
+def _from_string(input_value: str, delimiter: str) -> List[Any]:
+    return list(_split_string(input_value, delimiter))
+
+
+def _from_dict(input_value: Dict[str, Any], delimiter: str) -> List[Any]:
+    # Convert dict to array of key-value pairs
+    return [[key, value] for key, value in input_value.items()]
+
+
+def _from_value(input_value: Any, delimiter: str) -> List[Any]:
+    # Wrap single value in array
+    return [input_value]
+
+
+# Conversion functions by input type, in order of precedence
+_CONVERTERS: Dict[type, Callable[[Any, str], List[Any]]] = {
+    type(None): _from_none,
+    list: _from_sequence,
+    tuple: _from_sequence,
+    str: _from_string,
+    dict: _from_dict
+}
+
+
 class ArrayConverter(BaseNode):
     """
     Converts various data types to arrays.
     """
 
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.array_converter",
             name="Array Converter",
@@ -106,20 +147,7 @@ class ArrayConverter(BaseNode):
         delimiter = inputs.get("delimiter", ",")
 
         try:
-            # Handle different types
-            if input_value is None:
-                result = []
-            elif isinstance(input_value, (list, tuple)):
-                result = list(input_value)
-            elif isinstance(input_value, str):
-                # Split string by delimiter
-                result = [item.strip() for item in input_value.split(delimiter)]
-            elif isinstance(input_value, dict):
-                # Convert dict to array of key-value pairs
-                result = [[key, value] for key, value in input_value.items()]
-            else:
-                # Wrap single value in array
-                result = [input_value]
+            result = get_converter(_CONVERTERS, input_value, _from_value)(input_value, delimiter)
 
             return {
                 "array": result,
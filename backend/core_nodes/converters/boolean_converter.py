@@ -4,17 +4,64 @@ Boolean Converter Node
 This node converts various data types to booleans.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from backend.core_nodes.base_node import BaseNode
+from backend.core_nodes.converters._dispatch import get_converter, memoize_short_strings
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 
+
+# Common string representations of booleans
+_TRUE_STRINGS = frozenset(("true", "yes", "y", "1", "t"))
+_FALSE_STRINGS = frozenset(("false", "no", "n", "0", "f"))
+
+
+def _from_none(input_value: Any) -> bool:
+    return False
+
+
+def _from_bool(input_value: bool) -> bool:
+    return input_value
+
+
+@memoize_short_strings
+def _from_string(input_value: str) -> bool:
+    # Handle common string representations of booleans
+    lower_str = input_value.strip().lower()
+    if lower_str in _TRUE_STRINGS:
+        return True
+    elif lower_str in _FALSE_STRINGS:
+        return False
+    # Non-empty string is True, empty string is False
+    return True if input_value else False
+
+
+def _from_value(input_value: Any) -> bool:
+    # Numbers are True when non-zero and collections when non-empty; the
+    # conditional expression tests truth directly without calling bool()
+    return True if input_value else False
+
+
+# Conversion functions by input type, in order of precedence
+_CONVERTERS: Dict[type, Callable[[Any], bool]] = {
+    type(None): _from_none,
+    bool: _from_bool,
+    int: _from_value,
+    float: _from_value,
+    str: _from_string,
+    list: _from_value,
+    tuple: _from_value,
+    dict: _from_value
+}
+
+
 class BooleanConverter(BaseNode):
     """
     Converts various data types to booleans.
     """
 
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.boolean_converter",
             name="Boolean Converter",
@@ -94,32 +141,9 @@ class BooleanConverter(BaseNode):
             The output values
         """
         input_value = inputs.get("input")
-        default_value = inputs.get("default", False)
 
         try:
-            # Handle different types
-            if input_value is None:
-                result = False
-            elif isinstance(input_value, bool):
-                result = input_value
-            elif isinstance(input_value, (int, float)):
-                result = bool(input_value)
-            elif isinstance(input_value, str):
-                # Handle common string representations of booleans
-                lower_str = input_value.lower().strip()
-                if lower_str in ("true", "yes", "y", "1", "t"):
-                    result = True
-                elif lower_str in ("false", "no", "n", "0", "f"):
-                    result = False
-                else:
-                    # Non-empty string is True, empty string is False
-                    result = bool(input_value)
-            elif isinstance(input_value, (list, tuple, dict)):
-                # Non-empty collections are True, empty collections are False
-                result = bool(input_value)
-            else:
-                # Default behavior for other types
-                result = bool(input_value)
+            result = get_converter(_CONVERTERS, input_value, _from_value)(input_value)
 
             return {
                 "boolean": result,
@@ -127,6 +151,8 @@ class BooleanConverter(BaseNode):
                 "error": ""
             }
         except Exception as e:
+            # The default is only needed when the conversion fails
+            default_value = inputs.get("default", False)
             return {
                 "boolean": default_value,
                 "success": False,
@@ -4,17 +4,71 @@ Number Converter Node
 This node converts various data types to numbers.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from backend.core_nodes.base_node import BaseNode
+from backend.core_nodes.converters._dispatch import get_converter, memoize_short_strings
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 
+
+def _from_number(input_value: Any) -> float:
+    # Booleans are ints, so they convert to 1.0 and 0.0 here as well
+    return float(input_value)
+
+
+@memoize_short_strings
+def _from_string(input_value: str) -> float:
+    # Try to convert string to number
+    if input_value.strip() == "":
+        raise ValueError("Cannot convert empty string to number")
+
+    # Handle percentage strings
+    if input_value.strip().endswith("%"):
+        return float(input_value.strip()[:-1]) / 100
+    return float(input_value)
+
+
+def _from_sequence(input_value: Any) -> float:
+    # Take the first element if it's a list or tuple
+    if len(input_value) > 0:
+        return float(input_value[0])
+    return _from_value(input_value)
+
+
+def _from_value(input_value: Any) -> float:
+    raise ValueError(f"Cannot convert {type(input_value).__name__} to number")
+
+
+# Conversion functions by input type, in order of precedence
+_CONVERTERS: Dict[type, Callable[[Any], float]] = {
+    int: _from_number,
+    float: _from_number,
+    bool: _from_number,
+    str: _from_string,
+    list: _from_sequence,
+    tuple: _from_sequence
+}
+
+
+def _error_output(inputs: Dict[str, Any], error: str) -> Dict[str, Any]:
+    """Build the output for a failed conversion from the default input."""
+    default_value = inputs.get("default", 0)
+    return {
+        "number": default_value,
+        "integer": int(default_value),
+        "float": float(default_value),
+        "success": False,
+        "error": error
+    }
+
+
 class NumberConverter(BaseNode):
     """
     Converts various data types to numbers.
     """
 
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.number_converter",
             name="Number Converter",
@@ -112,44 +166,30 @@ class NumberConverter(BaseNode):
             The output values
         """
         input_value = inputs.get("input")
-        default_value = inputs.get("default", 0)
+
+        # Missing and blank inputs are common, so they fail without raising
+        if input_value is None:
+            return _error_output(inputs, "Cannot convert None to number")
+        value_type = type(input_value)
+        if value_type is str and not input_value.strip():
+            return _error_output(inputs, "Cannot convert empty string to number")
 
         try:
-            # Handle different types
-            if input_value is None:
-                raise ValueError("Cannot convert None to number")
-            elif isinstance(input_value, (int, float)):
+            # Plain numbers skip the converter lookup
+            if value_type is float:
+                number = input_value
+            elif value_type is int or value_type is bool:
                 number = float(input_value)
-            elif isinstance(input_value, str):
-                # Try to convert string to number
-                if input_value.strip() == "":
-                    raise ValueError("Cannot convert empty string to number")
-
-                # Handle percentage strings
-                if input_value.strip().endswith("%"):
-                    number = float(input_value.strip()[:-1]) / 100
-                else:
-                    number = float(input_value)
-            elif isinstance(input_value, bool):
-                number = 1 if input_value else 0
-            elif isinstance(input_value, (list, tuple)) and len(input_value) > 0:
-                # Take the first element if it's a list or tuple
-                number = float(input_value[0])
             else:
-                raise ValueError(f"Cannot convert {type(input_value).__name__} to number")
+                number = get_converter(_CONVERTERS, input_value, _from_value)(input_value)
 
+            # Every conversion produces a float, so it doubles as the float output
             return {
                 "number": number,
                 "integer": int(number),
-                "float": float(number),
+                "float": number,
                 "success": True,
                 "error": ""
             }
         except Exception as e:
-            return {
-                "number": default_value,
-                "integer": int(default_value),
-                "float": float(default_value),
-                "success": False,
-                "error": str(e)
-            }
+            return _error_output(inputs, str(e))
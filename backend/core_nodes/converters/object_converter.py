@@ -4,18 +4,66 @@ Object Converter Node
 This node converts various data types to objects.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from backend.core_nodes.base_node import BaseNode
+from backend.core_nodes._json import JSON_START_CHARS, JSON_WHITESPACE, loads
+from backend.core_nodes.converters._dispatch import get_converter
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 import json
 
+
+def _from_none(input_value: Any, key: str) -> Dict[str, Any]:
+    return {}
+
+
+def _from_dict(input_value: Dict[str, Any], key: str) -> Dict[str, Any]:
+    return input_value
+
+
+def _from_string(input_value: str, key: str) -> Dict[str, Any]:
+    # Plain strings can't be JSON, so skip the parse attempt and its exception
+    if input_value.lstrip(JSON_WHITESPACE)[:1] not in JSON_START_CHARS:
+        return {key: input_value}
+
+    # Try to parse as JSON
+    try:
+        result = loads(input_value)
+    except json.JSONDecodeError:
+        # If not valid JSON, use as a simple value
+        return {key: input_value}
+    if not isinstance(result, dict):
+        result = {key: result}
+    return result
+
+
+def _from_sequence(input_value: Any, key: str) -> Dict[str, Any]:
+    # Convert array to object with indices as keys
+    return {str(i): value for i, value in enumerate(input_value)}
+
+
+def _from_value(input_value: Any, key: str) -> Dict[str, Any]:
+    # Wrap single value in object
+    return {key: input_value}
+
+
+# Conversion functions by input type, in order of precedence
+_CONVERTERS: Dict[type, Callable[[Any, str], Dict[str, Any]]] = {
+    type(None): _from_none,
+    dict: _from_dict,
+    str: _from_string,
+    list: _from_sequence,
+    tuple: _from_sequence
+}
+
+
 class ObjectConverter(BaseNode):
     """
     Converts various data types to objects.
     """
 
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.object_converter",
             name="Object Converter",
@@ -107,30 +155,11 @@ class ObjectConverter(BaseNode):
         key = inputs.get("key", "value")
 
         try:
-            # Handle different types
-            if input_value is None:
-                result = {}
-            elif isinstance(input_value, dict):
-                result = input_value
-            elif isinstance(input_value, str):
-                # Try to parse as JSON
-                try:
-                    result = json.loads(input_value)
-                    if not isinstance(result, dict):
-                        result = {key: result}
-                except json.JSONDecodeError:
-                    # If not valid JSON, use as a simple value
-                    result = {key: input_value}
-            elif isinstance(input_value, (list, tuple)):
-                # Convert array to object with indices as keys
-                result = {str(i): value for i, value in enumerate(input_value)}
-            else:
-                # Wrap single value in object
-                result = {key: input_value}
+            result = get_converter(_CONVERTERS, input_value, _from_value)(input_value, key)
 
             return {
                 "object": result,
-                "keys": list(result.keys()),
+                "keys": list(result),
                 "success": True,
                 "error": ""
             }
@@ -4,17 +4,116 @@ String Converter Node
 This node converts various data types to strings.
 """
 
-from typing import Dict, Any, Optional
+import functools
+import json
+import string
+from typing import Dict, Any, Optional, Callable
 from backend.core_nodes.base_node import BaseNode
+from backend.core_nodes.converters._dispatch import get_converter
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 
+
+_FORMATTER = string.Formatter()
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_format(format_str: str) -> Callable[[Any], str]:
+    """
+    Compile a format string into a function that formats a single value.
+
+    Format strings with one plain replacement field, such as "{:.2f}" or
+    "Total: {0:,}", are parsed once and applied with format(). Anything
+    more involved falls back to str.format.
+
+    Args:
+        format_str: The format string
+
+    Returns:
+        A function that formats a value with the format string
+    """
+    try:
+        parsed = list(_FORMATTER.parse(format_str))
+    except ValueError:
+        # Malformed format strings raise again when called
+        return format_str.format
+
+    prefix_parts = []
+    suffix_parts = []
+    format_spec = None
+    for literal_text, field_name, field_spec, conversion in parsed:
+        (prefix_parts if format_spec is None else suffix_parts).append(literal_text)
+        if field_name is None:
+            continue
+        if format_spec is not None or field_name not in ("", "0") or conversion or "{" in field_spec:
+            return format_str.format
+        format_spec = field_spec
+
+    if format_spec is None:
+        return format_str.format
+
+    prefix = "".join(prefix_parts)
+    suffix = "".join(suffix_parts)
+
+    def format_value(value: Any) -> str:
+        return prefix + format(value, format_spec) + suffix
+
+    return format_value
+
+
+def _from_none(input_value: Any, format_str: str) -> str:
+    return "null"
+
+
+def _from_string(input_value: str, format_str: str) -> str:
+    return input_value
+
+
+def _from_number(input_value: Any, format_str: str) -> str:
+    # Booleans are ints, so they are formatted here as well
+    if format_str:
+        try:
+            return _compile_format(format_str)(input_value)
+        except (ValueError, TypeError, KeyError, IndexError, AttributeError):
+            pass
+    return str(input_value)
+
+
+def _from_sequence(input_value: Any, format_str: str) -> str:
+    return ", ".join(str(item) for item in input_value)
+
+
+def _from_dict(input_value: Dict[str, Any], format_str: str) -> str:
+    try:
+        return json.dumps(input_value, indent=2)
+    except (TypeError, ValueError):
+        return str(input_value)
+
+
+def _from_value(input_value: Any, format_str: str) -> str:
+    return str(input_value)
+
+
+# Conversion functions by input type, in order of precedence
+_CONVERTERS: Dict[type, Callable[[Any, str], str]] = {
+    type(None): _from_none,
+    str: _from_string,
+    int: _from_number,
+    float: _from_number,
+    bool: _from_number,
+    list: _from_sequence,
+    tuple: _from_sequence,
+    dict: _from_dict
+}
+
+
 class StringConverter(BaseNode):
     """
     Converts various data types to strings.
     """
 
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.string_converter",
             name="String Converter",
@@ -97,31 +196,7 @@ class StringConverter(BaseNode):
         format_str = inputs.get("format", "")
 
         try:
-            # Handle different types
-            if input_value is None:
-                result = "null"
-            elif isinstance(input_value, str):
-                result = input_value
-            elif isinstance(input_value, (int, float)):
-                if format_str:
-                    try:
-                        result = format_str.format(input_value)
-                    except:
-                        result = str(input_value)
-                else:
-                    result = str(input_value)
-            elif isinstance(input_value, bool):
-                result = str(input_value).lower()
-            elif isinstance(input_value, (list, tuple)):
-                result = ", ".join(str(item) for item in input_value)
-            elif isinstance(input_value, dict):
-                try:
-                    import json
-                    result = json.dumps(input_value, indent=2)
-                except:
-                    result = str(input_value)
-            else:
-                result = str(input_value)
+            result = get_converter(_CONVERTERS, input_value, _from_value)(input_value, format_str)
 
             return {
                 "string": result,
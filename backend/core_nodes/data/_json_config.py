@@ -0,0 +1,41 @@
+"""
+JSON config values shared by the data nodes.
+"""
+
+from functools import lru_cache
+from typing import Any
+import json
+import pickle
+
+
+@lru_cache(maxsize=128)
+def parse_json_value(value_str: str) -> Any:
+    """
+    Parse a JSON config value, returning None if it is not valid JSON.
+
+    Config values stay the same across executions, so parsed values are
+    cached. Callers must not modify the returned value.
+    """
+    try:
+        return json.loads(value_str)
+    except json.JSONDecodeError:
+        return None
+
+
+def copy_json_value(value: Any) -> Any:
+    """
+    Copy a value parsed from JSON.
+
+    Such values only hold plain dicts, lists and scalars, which a pickle
+    round trip copies several times faster than copy.deepcopy.
+    """
+    return pickle.loads(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+
+def config_value(value_str: str) -> Any:
+    """Get a parsed JSON config value that the caller is free to modify."""
+    value = parse_json_value(value_str)
+    if isinstance(value, (dict, list)):
+        # Parsed values are cached and shared, so containers are copied
+        value = copy_json_value(value)
+    return value
@@ -0,0 +1,49 @@
+"""
+Duplicate removal shared by the data nodes.
+"""
+
+from typing import Any, List
+
+
+def unique_key(value: Any) -> Any:
+    """
+    Build a hashable key for a value that compares equal exactly when the values do.
+
+    Dicts and lists are converted recursively; any other unhashable value
+    raises TypeError.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return (dict, frozenset([(key, unique_key(item)) for key, item in value.items()]))
+    if value_type is list:
+        return (list, tuple([unique_key(item) for item in value]))
+    hash(value)
+    return value
+
+
+def unique_items(items: List[Any]) -> List[Any]:
+    """Remove duplicate items, keeping the first occurrence of each."""
+    try:
+        return list(dict.fromkeys(items))
+    except TypeError:
+        pass
+
+    # Dicts and lists aren't hashable, so key them by content
+    try:
+        seen = set()
+        unique = []
+        for item in items:
+            key = unique_key(item)
+            if key not in seen:
+                seen.add(key)
+                unique.append(item)
+        return unique
+    except TypeError:
+        pass
+
+    # Items we can't build a key for, do it manually
+    unique = []
+    for item in items:
+        if item not in unique:
+            unique.append(item)
+    return unique
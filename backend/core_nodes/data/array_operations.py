@@ -1,6 +1,180 @@
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 from backend.core_nodes.base_node import BaseNode
+from backend.core_nodes.data._unique import unique_items
+
+# Operations that only read the input array or build a new list from it;
+# everything else works on a shallow copy so the caller's list is untouched
+_NON_MUTATING_OPERATIONS = frozenset(["get", "find_index", "filter", "map", "join"])
+
+
+@lru_cache(maxsize=128)
+def _parse_indices(default_index: Any, slice_start: Any, slice_end: Any) -> Tuple[int, int, int]:
+    """Convert the numeric config values, which stay the same across executions."""
+    return int(default_index), int(slice_start), int(slice_end)
+
+
+def _op_get(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Get the item at the index."""
+    if 0 <= idx < len(array):
+        return array[idx], array
+    return None, array
+
+
+def _op_add(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Add the item to the end of the array, returning its index."""
+    if item is not None:
+        array.append(item)
+        return len(array) - 1, array
+    return None, array
+
+
+def _op_remove(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Remove the first matching item, finding it with a single scan."""
+    try:
+        del array[array.index(item)]
+        return True, array
+    except ValueError:
+        return False, array
+
+
+def _op_remove_at(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Remove the item at the index, returning it."""
+    if 0 <= idx < len(array):
+        return array.pop(idx), array
+    return None, array
+
+
+def _op_insert_at(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Insert the item at the index, clamped to the array bounds."""
+    if item is not None:
+        idx = max(0, min(idx, len(array)))
+        array.insert(idx, item)
+        return idx, array
+    return None, array
+
+
+def _op_find_index(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Find the index of the item, or -1."""
+    try:
+        return array.index(item), array
+    except ValueError:
+        return -1, array
+
+
+def _op_filter(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Keep the dicts whose property equals the filter value."""
+    filter_property = config.get("filter_property", "")
+    if filter_property:
+        filter_value = config.get("filter_value", "")
+        array = [
+            item for item in array
+            if isinstance(item, dict) and item.get(filter_property) == filter_value
+        ]
+    return len(array), array
+
+
+def _op_map(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Replace each dict with the value of its property."""
+    filter_property = config.get("filter_property", "")
+    if filter_property:
+        array = [
+            item.get(filter_property) if isinstance(item, dict) else item
+            for item in array
+        ]
+    return len(array), array
+
+
+def _op_sort(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Sort the array, by property if one is configured."""
+    sort_property = config.get("sort_property", "")
+    reverse = config.get("sort_direction", "asc") == "desc"
+    if sort_property:
+        # Sort by property. When every item is a dict that has the
+        # property, itemgetter gives the same keys without a Python
+        # call per item.
+        sorted_by_itemgetter = False
+        if all(map(isinstance, array, repeat(dict))):
+            try:
+                array.sort(key=itemgetter(sort_property), reverse=reverse)
+                sorted_by_itemgetter = True
+            except KeyError:
+                # Some item lacks the property; the list is left as it was
+                pass
+        if not sorted_by_itemgetter:
+            array.sort(
+                key=lambda x: x.get(sort_property) if isinstance(x, dict) else x,
+                reverse=reverse
+            )
+    else:
+        # Simple sort
+        try:
+            array.sort(reverse=reverse)
+        except (TypeError, ValueError):
+            # If sorting fails, leave array unchanged
+            pass
+    return True, array
+
+
+def _op_reverse(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Reverse the array."""
+    array.reverse()
+    return True, array
+
+
+def _op_join(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Join the array into a string."""
+    join_delimiter = config.get("join_delimiter", ",")
+    try:
+        try:
+            # Arrays of strings join directly without a str() call per item.
+            # str.join raises TypeError rather than AttributeError for a
+            # delimiter that isn't a string.
+            return str.join(join_delimiter, array), array
+        except TypeError:
+            return str.join(join_delimiter, map(str, array)), array
+    except (TypeError, ValueError):
+        return "", array
+
+
+def _op_slice(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Slice the array; a negative end means the end of the array."""
+    _, slice_start, slice_end = _parse_indices(
+        config.get("default_index", 0),
+        config.get("slice_start", 0),
+        config.get("slice_end", -1)
+    )
+    # Slicing clamps out-of-range bounds itself; None runs to the end
+    array = array[slice_start:slice_end if slice_end >= 0 else None]
+    return len(array), array
+
+
+def _op_unique(array: List[Any], item: Any, idx: int, config: Dict[str, Any]) -> Tuple[Any, List[Any]]:
+    """Remove duplicates, keeping the first occurrence of each item."""
+    array = unique_items(array)
+    return len(array), array
+
+
+# Handler for each operation
+_OPERATIONS: Dict[str, Callable] = {
+    "get": _op_get,
+    "add": _op_add,
+    "remove": _op_remove,
+    "remove_at": _op_remove_at,
+    "insert_at": _op_insert_at,
+    "find_index": _op_find_index,
+    "filter": _op_filter,
+    "map": _op_map,
+    "sort": _op_sort,
+    "reverse": _op_reverse,
+    "join": _op_join,
+    "slice": _op_slice,
+    "unique": _op_unique
+}
+
 
 class ArrayOperations(BaseNode):
     """
@@ -9,8 +183,11 @@ class ArrayOperations(BaseNode):
     This node can manipulate arrays in various ways.
     """
     
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    __slots__ = ()
+    
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.array_operations",
             name="Array Operations",
@@ -188,8 +365,6 @@ class ArrayOperations(BaseNode):
         Returns:
             The result of the operation
         """
-        import copy
-        
         # Get inputs
         array = inputs.get("array", [])
         item = inputs.get("item")
@@ -197,137 +372,39 @@ class ArrayOperations(BaseNode):
         
         # Ensure array is a list
         if not isinstance(array, list):
-            try:
-                array = list(array)
-            except:
-                array = [array] if array is not None else []
-        
-        # Make a copy to avoid modifying the original
-        array_copy = copy.deepcopy(array)
+            if array is None:
+                array = []
+            else:
+                try:
+                    array = list(array)
+                except TypeError:
+                    # Not iterable, treat it as a single item
+                    array = [array]
         
         # Get configuration
         operation = config.get("operation", "get")
-        default_index = int(config.get("default_index", 0))
-        filter_property = config.get("filter_property", "")
-        filter_value = config.get("filter_value", "")
-        sort_property = config.get("sort_property", "")
-        sort_direction = config.get("sort_direction", "asc")
-        join_delimiter = config.get("join_delimiter", ",")
-        slice_start = int(config.get("slice_start", 0))
-        slice_end = int(config.get("slice_end", -1))
+        default_index = _parse_indices(
+            config.get("default_index", 0),
+            config.get("slice_start", 0),
+            config.get("slice_end", -1)
+        )[0]
+        
+        # Only copy when the operation modifies the array. None of the
+        # operations touch the items themselves, so a shallow copy is enough.
+        if operation in _NON_MUTATING_OPERATIONS:
+            array_copy = array
+        else:
+            array_copy = list(array)
         
         # Use input index or default
         idx = index if index is not None else default_index
         
         # Perform the operation
-        result = None
-        
-        if operation == "get":
-            # Get item at index
-            if 0 <= idx < len(array_copy):
-                result = array_copy[idx]
-        
-        elif operation == "add":
-            # Add item to end of array
-            if item is not None:
-                array_copy.append(item)
-                result = len(array_copy) - 1  # Return index of added item
-        
-        elif operation == "remove":
-            # Remove item from array
-            if item in array_copy:
-                array_copy.remove(item)
-                result = True
-            else:
-                result = False
-        
-        elif operation == "remove_at":
-            # Remove item at index
-            if 0 <= idx < len(array_copy):
-                result = array_copy.pop(idx)
-        
-        elif operation == "insert_at":
-            # Insert item at index
-            if item is not None:
-                idx = max(0, min(idx, len(array_copy)))
-                array_copy.insert(idx, item)
-                result = idx
-        
-        elif operation == "find_index":
-            # Find index of item
-            try:
-                result = array_copy.index(item)
-            except ValueError:
-                result = -1
-        
-        elif operation == "filter":
-            # Filter array by property value
-            if filter_property:
-                array_copy = [
-                    item for item in array_copy
-                    if isinstance(item, dict) and item.get(filter_property) == filter_value
-                ]
-            result = len(array_copy)
-        
-        elif operation == "map":
-            # Map array by extracting property
-            if filter_property:
-                array_copy = [
-                    item.get(filter_property) if isinstance(item, dict) else item
-                    for item in array_copy
-                ]
-            result = len(array_copy)
-        
-        elif operation == "sort":
-            # Sort array
-            if sort_property:
-                # Sort by property
-                array_copy.sort(
-                    key=lambda x: x.get(sort_property) if isinstance(x, dict) else x,
-                    reverse=(sort_direction == "desc")
-                )
-            else:
-                # Simple sort
-                try:
-                    array_copy.sort(reverse=(sort_direction == "desc"))
-                except:
-                    # If sorting fails, leave array unchanged
-                    pass
-            result = True
-        
-        elif operation == "reverse":
-            # Reverse array
-            array_copy.reverse()
-            result = True
-        
-        elif operation == "join":
-            # Join array into string
-            try:
-                result = join_delimiter.join(str(x) for x in array_copy)
-                array_copy = array  # Keep original array
-            except:
-                result = ""
-        
-        elif operation == "slice":
-            # Slice array
-            if slice_end < 0:
-                slice_end = len(array_copy)
-            array_copy = array_copy[slice_start:slice_end]
-            result = len(array_copy)
-        
-        elif operation == "unique":
-            # Get unique items
-            try:
-                # Try to use set for efficiency
-                array_copy = list(set(array_copy))
-            except:
-                # If items aren't hashable, do it manually
-                unique_items = []
-                for item in array_copy:
-                    if item not in unique_items:
-                        unique_items.append(item)
-                array_copy = unique_items
-            result = len(array_copy)
+        handler = _OPERATIONS.get(operation)
+        if handler is None:
+            result = None
+        else:
+            result, array_copy = handler(array_copy, item, idx, config)
         
         return {
             "result": result,
@@ -342,10 +419,12 @@ class ArrayOperations(BaseNode):
             return "Operation is required"
         
         try:
-            default_index = int(config.get("default_index", 0))
-            slice_start = int(config.get("slice_start", 0))
-            slice_end = int(config.get("slice_end", -1))
-        except ValueError:
+            _parse_indices(
+                config.get("default_index", 0),
+                config.get("slice_start", 0),
+                config.get("slice_end", -1)
+            )
+        except (ValueError, TypeError):
             return "Invalid numeric value in configuration"
         
         return None
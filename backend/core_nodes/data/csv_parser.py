@@ -1,9 +1,40 @@
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 import csv
 import io
+import itertools
+from operator import itemgetter
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 from backend.core_nodes.base_node import BaseNode
 
+
+@lru_cache(maxsize=128)
+def _parse_custom_headers(custom_headers_str: str) -> Tuple[str, ...]:
+    """Split the custom headers config, which stays the same across executions."""
+    return tuple([h.strip() for h in custom_headers_str.split(",")])
+
+
+def _generate_rows(items: List[Any], headers: List[str]) -> List[Sequence[Any]]:
+    """Build the CSV rows for the items of a generate input."""
+    # Plain dicts that all have every header can be read with a single
+    # itemgetter; a single header would make it return bare values
+    if len(headers) > 1 and set(map(type, items)) == {dict}:
+        try:
+            return list(map(itemgetter(*headers), items))
+        except KeyError:
+            pass
+    
+    return [
+        # Extract values in header order
+        [item.get(header, "") for header in headers] if isinstance(item, dict)
+        # Write list directly
+        else item if isinstance(item, list)
+        # Write single value
+        else [item]
+        for item in items
+    ]
+
+
 class CsvParser(BaseNode):
     """
     A core node for parsing and generating CSV.
@@ -11,8 +42,11 @@ class CsvParser(BaseNode):
     This node can convert between CSV strings and arrays of objects.
     """
     
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    __slots__ = ()
+    
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.csv_parser",
             name="CSV Parser",
@@ -147,7 +181,7 @@ class CsvParser(BaseNode):
         # Parse custom headers if provided
         custom_headers = None
         if custom_headers_str:
-            custom_headers = [h.strip() for h in custom_headers_str.split(",")]
+            custom_headers = list(_parse_custom_headers(custom_headers_str))
         
         # Initialize outputs
         output = None
@@ -161,8 +195,8 @@ class CsvParser(BaseNode):
                     error = "Input must be a string for parse operation"
                     return {"output": None, "headers": [], "error": error}
                 
-                # Parse CSV
-                csv_data = []
+                # Parse CSV, reading rows as they are consumed rather than
+                # holding every raw row alongside the converted output
                 csv_reader = csv.reader(
                     io.StringIO(input_value),
                     delimiter=delimiter,
@@ -170,37 +204,34 @@ class CsvParser(BaseNode):
                     skipinitialspace=skip_initial_space
                 )
                 
-                # Read rows
-                rows = list(csv_reader)
-                if not rows:
+                # Read the first row
+                first_row = next(csv_reader, None)
+                if first_row is None:
                     return {"output": [], "headers": [], "error": None}
                 
                 # Get headers
+                data_rows = csv_reader
                 if has_header:
-                    headers = rows[0]
-                    data_rows = rows[1:]
+                    row_headers = first_row
                 else:
                     # Use custom headers or generate column names
                     if custom_headers:
-                        headers = custom_headers
+                        row_headers = custom_headers
                     else:
                         # Generate column names (Column1, Column2, etc.)
-                        headers = [f"Column{i+1}" for i in range(len(rows[0]))]
-                    data_rows = rows
+                        row_headers = [f"Column{i+1}" for i in range(len(first_row))]
+                    data_rows = itertools.chain([first_row], csv_reader)
                 
-                # Convert to objects if has headers
+                # Convert to objects if has headers; zip drops values
+                # beyond the last header
                 if has_header or custom_headers:
-                    for row in data_rows:
-                        # Create object with header keys
-                        row_obj = {}
-                        for i, value in enumerate(row):
-                            if i < len(headers):
-                                row_obj[headers[i]] = value
-                        csv_data.append(row_obj)
+                    csv_data = [dict(zip(row_headers, row)) for row in data_rows]
                 else:
                     # Just return arrays
-                    csv_data = data_rows
+                    csv_data = list(data_rows)
                 
+                # Only report headers once the whole input has parsed
+                headers = row_headers
                 output = csv_data
             
             elif operation == "generate":
@@ -231,18 +262,8 @@ class CsvParser(BaseNode):
                 if has_header and headers:
                     csv_writer.writerow(headers)
                 
-                # Write data rows
-                for item in input_value:
-                    if isinstance(item, dict):
-                        # Extract values in header order
-                        row = [item.get(header, "") for header in headers]
-                        csv_writer.writerow(row)
-                    elif isinstance(item, list):
-                        # Write list directly
-                        csv_writer.writerow(item)
-                    else:
-                        # Write single value
-                        csv_writer.writerow([item])
+                # Write data rows in one writerows call
+                csv_writer.writerows(_generate_rows(input_value, headers))
                 
                 output = output_buffer.getvalue()
                 output_buffer.close()
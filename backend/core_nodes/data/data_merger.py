@@ -1,6 +1,183 @@
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 from backend.core_nodes.base_node import BaseNode
+from backend.core_nodes.data._unique import unique_items
+
+
+def _as_arrays(valid_inputs: List[Any]) -> List[List[Any]]:
+    """Wrap each input that isn't an array in a single-item array."""
+    # None inputs were already dropped, so every input becomes one item
+    return [inp if isinstance(inp, list) else [inp] for inp in valid_inputs]
+
+
+def _merge_concat(valid_inputs: List[Any], config: Dict[str, Any]) -> List[Any]:
+    """Concatenate the inputs, optionally flattening and removing duplicates."""
+    flatten = config.get("flatten", False)
+    unique = config.get("unique", False)
+    
+    # Concatenate arrays, flattening nested arrays while copying if requested
+    result = []
+    
+    for inp in valid_inputs:
+        if not isinstance(inp, list):
+            result.append(inp)
+        elif flatten:
+            for item in inp:
+                if isinstance(item, list):
+                    result.extend(item)
+                else:
+                    result.append(item)
+        else:
+            result.extend(inp)
+    
+    # Remove duplicates if requested
+    if unique:
+        result = unique_items(result)
+    
+    return result
+
+
+def _merge_objects(valid_inputs: List[Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge the object inputs into one object."""
+    overwrite = config.get("overwrite", True)
+    result = {}
+    
+    for inp in valid_inputs:
+        if isinstance(inp, dict):
+            if overwrite or not result:
+                # Simple update; with nothing merged yet there are no
+                # existing keys to keep either
+                result.update(inp)
+            else:
+                # Only add keys that don't exist
+                for key, value in inp.items():
+                    if key not in result:
+                        result[key] = value
+    
+    return result
+
+
+def _merge_join(valid_inputs: List[Any], config: Dict[str, Any]) -> List[Any]:
+    """Join arrays of objects on the join key."""
+    join_key = config.get("join_key", "")
+    overwrite = config.get("overwrite", True)
+    if not join_key:
+        raise ValueError("Join key is required for join mode")
+    
+    arrays = _as_arrays(valid_inputs)
+    
+    if len(arrays) < 2:
+        return arrays[0] if arrays else []
+    
+    # Perform join
+    result = []
+    
+    # Build lookup tables for each array after the first
+    lookups = []
+    for arr in arrays[1:]:
+        lookup = {}
+        for item in arr:
+            if isinstance(item, dict) and join_key in item:
+                key_value = item[join_key]
+                lookup[key_value] = item
+        lookups.append(lookup)
+    
+    # Join with first array
+    for item in arrays[0]:
+        if isinstance(item, dict) and join_key in item:
+            key_value = item[join_key]
+            # Only top-level keys are written, so a shallow copy keeps the
+            # input rows unchanged
+            joined_item = dict(item)
+            
+            # Look for matching items in other arrays; lookup values are
+            # always dicts, so None means no match
+            for lookup in lookups:
+                matching_item = lookup.get(key_value)
+                if matching_item is not None:
+                    # Merge with joined item, keeping our own join key value
+                    # unless overwriting
+                    joined_item.update(matching_item)
+                    if not overwrite:
+                        joined_item[join_key] = key_value
+            
+            result.append(joined_item)
+    
+    return result
+
+
+def _merge_zip(valid_inputs: List[Any], config: Dict[str, Any]) -> List[Any]:
+    """Combine corresponding elements of the inputs."""
+    arrays = _as_arrays(valid_inputs)
+    
+    # Zip the arrays, converting each tuple to a list as it is produced
+    return list(map(list, zip(*arrays)))
+
+
+def _merge_union(valid_inputs: List[Any], config: Dict[str, Any]) -> List[Any]:
+    """Unique items from all inputs."""
+    result = []
+    
+    for inp in valid_inputs:
+        if isinstance(inp, list):
+            result.extend(inp)
+        else:
+            result.append(inp)
+    
+    # Unhashable items such as dicts are compared by content
+    return unique_items(result)
+
+
+def _merge_intersection(valid_inputs: List[Any], config: Dict[str, Any]) -> List[Any]:
+    """Items common to all inputs."""
+    if not valid_inputs:
+        return []
+    
+    # Start from the smallest input so the working set never holds more
+    # than its items
+    inputs_by_size = sorted(_as_arrays(valid_inputs), key=len)
+    result = set(inputs_by_size[0])
+    
+    # Intersect with other inputs, stopping once nothing is left
+    for inp in inputs_by_size[1:]:
+        if not result:
+            break
+        result.intersection_update(inp)
+    
+    return list(result)
+
+
+def _merge_difference(valid_inputs: List[Any], config: Dict[str, Any]) -> List[Any]:
+    """Items in the first input but not in the others."""
+    if not valid_inputs:
+        return []
+    
+    # Convert first input to set
+    if isinstance(valid_inputs[0], list):
+        result = set(valid_inputs[0])
+    else:
+        result = {valid_inputs[0]}
+    
+    # Subtract other inputs in a single call
+    result.difference_update(*[
+        inp if isinstance(inp, list) else (inp,)
+        for inp in valid_inputs[1:]
+    ])
+    
+    return list(result)
+
+
+# Handler for each merge mode
+_MERGE_MODES: Dict[str, Callable] = {
+    "concat": _merge_concat,
+    "merge_objects": _merge_objects,
+    "join": _merge_join,
+    "zip": _merge_zip,
+    "union": _merge_union,
+    "intersection": _merge_intersection,
+    "difference": _merge_difference
+}
+
 
 class DataMerger(BaseNode):
     """
@@ -9,8 +186,9 @@ class DataMerger(BaseNode):
     This node can combine data from different sources in various ways.
     """
     
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.data_merger",
             name="Data Merger",
@@ -148,8 +326,6 @@ class DataMerger(BaseNode):
         Returns:
             The merged data
         """
-        import copy
-        
         # Get inputs
         input1 = inputs.get("input1")
         input2 = inputs.get("input2")
@@ -157,10 +333,6 @@ class DataMerger(BaseNode):
         
         # Get configuration
         merge_mode = config.get("merge_mode", "concat")
-        join_key = config.get("join_key", "")
-        flatten = config.get("flatten", False)
-        unique = config.get("unique", False)
-        overwrite = config.get("overwrite", True)
         
         # Collect all inputs
         all_inputs = [input1, input2, input3]
@@ -171,203 +343,17 @@ class DataMerger(BaseNode):
         count = 0
         error = None
         
-        try:
-            if merge_mode == "concat":
-                # Concatenate arrays
-                result = []
-                
-                for inp in valid_inputs:
-                    if isinstance(inp, list):
-                        result.extend(inp)
-                    else:
-                        result.append(inp)
-                
-                # Flatten nested arrays if requested
-                if flatten:
-                    flat_result = []
-                    for item in result:
-                        if isinstance(item, list):
-                            flat_result.extend(item)
-                        else:
-                            flat_result.append(item)
-                    result = flat_result
-                
-                # Remove duplicates if requested
-                if unique:
-                    try:
-                        # Try to use set for efficiency
-                        result = list(set(result))
-                    except:
-                        # If items aren't hashable, do it manually
-                        unique_items = []
-                        for item in result:
-                            if item not in unique_items:
-                                unique_items.append(item)
-                        result = unique_items
-                
-                output = result
-                count = len(result)
-            
-            elif merge_mode == "merge_objects":
-                # Merge objects
-                result = {}
-                
-                for inp in valid_inputs:
-                    if isinstance(inp, dict):
-                        if overwrite:
-                            # Simple update
-                            result.update(inp)
-                        else:
-                            # Only add keys that don't exist
-                            for key, value in inp.items():
-                                if key not in result:
-                                    result[key] = value
-                
-                output = result
-                count = len(result)
-            
-            elif merge_mode == "join":
-                # Join arrays of objects based on key
-                if not join_key:
-                    error = "Join key is required for join mode"
-                    return {"output": None, "count": 0, "error": error}
-                
-                # Ensure all inputs are arrays
-                arrays = []
-                for inp in valid_inputs:
-                    if isinstance(inp, list):
-                        arrays.append(inp)
-                    else:
-                        arrays.append([inp] if inp is not None else [])
-                
-                if len(arrays) < 2:
-                    output = arrays[0] if arrays else []
-                    count = len(output)
-                    return {"output": output, "count": count, "error": None}
-                
-                # Perform join
-                result = []
-                
-                # Build lookup tables for each array after the first
-                lookups = []
-                for arr in arrays[1:]:
-                    lookup = {}
-                    for item in arr:
-                        if isinstance(item, dict) and join_key in item:
-                            key_value = item[join_key]
-                            lookup[key_value] = item
-                    lookups.append(lookup)
-                
-                # Join with first array
-                for item in arrays[0]:
-                    if isinstance(item, dict) and join_key in item:
-                        key_value = item[join_key]
-                        joined_item = copy.deepcopy(item)
-                        
-                        # Look for matching items in other arrays
-                        for lookup in lookups:
-                            if key_value in lookup:
-                                matching_item = lookup[key_value]
-                                # Merge with joined item
-                                for k, v in matching_item.items():
-                                    if k != join_key or overwrite:
-                                        joined_item[k] = v
-                        
-                        result.append(joined_item)
-                
-                output = result
-                count = len(result)
-            
-            elif merge_mode == "zip":
-                # Zip arrays (combine corresponding elements)
-                # Ensure all inputs are arrays
-                arrays = []
-                for inp in valid_inputs:
-                    if isinstance(inp, list):
-                        arrays.append(inp)
-                    else:
-                        arrays.append([inp] if inp is not None else [])
-                
-                # Zip the arrays
-                result = list(zip(*arrays))
-                
-                # Convert tuples to lists
-                result = [list(item) for item in result]
-                
-                output = result
-                count = len(result)
-            
-            elif merge_mode == "union":
-                # Union of sets (unique items from all inputs)
-                result = set()
-                
-                for inp in valid_inputs:
-                    if isinstance(inp, list):
-                        try:
-                            result.update(inp)
-                        except:
-                            # If items aren't hashable, do it manually
-                            for item in inp:
-                                result.add(item)
-                    else:
-                        result.add(inp)
-                
-                output = list(result)
-                count = len(output)
-            
-            elif merge_mode == "intersection":
-                # Intersection of sets (items common to all inputs)
-                if not valid_inputs:
-                    output = []
-                    count = 0
-                    return {"output": output, "count": count, "error": None}
-                
-                # Convert first input to set
-                if isinstance(valid_inputs[0], list):
-                    result = set(valid_inputs[0])
-                else:
-                    result = {valid_inputs[0]}
-                
-                # Intersect with other inputs
-                for inp in valid_inputs[1:]:
-                    if isinstance(inp, list):
-                        result.intersection_update(inp)
-                    else:
-                        result.intersection_update({inp})
-                
-                output = list(result)
-                count = len(output)
-            
-            elif merge_mode == "difference":
-                # Difference of sets (items in first input but not in others)
-                if not valid_inputs:
-                    output = []
-                    count = 0
-                    return {"output": output, "count": count, "error": None}
-                
-                # Convert first input to set
-                if isinstance(valid_inputs[0], list):
-                    result = set(valid_inputs[0])
-                else:
-                    result = {valid_inputs[0]}
-                
-                # Subtract other inputs
-                for inp in valid_inputs[1:]:
-                    if isinstance(inp, list):
-                        result.difference_update(inp)
-                    else:
-                        result.difference_update({inp})
-                
-                output = list(result)
+        handler = _MERGE_MODES.get(merge_mode)
+        if handler is None:
+            error = f"Unknown merge mode: {merge_mode}"
+        else:
+            try:
+                output = handler(valid_inputs, config)
                 count = len(output)
-            
-            else:
-                error = f"Unknown merge mode: {merge_mode}"
-        
-        except Exception as e:
-            error = str(e)
-            output = None
-            count = 0
+            except Exception as e:
+                error = str(e)
+                output = None
+                count = 0
         
         return {
             "output": output,
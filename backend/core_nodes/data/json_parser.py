@@ -1,7 +1,37 @@
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import json
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 from backend.core_nodes.base_node import BaseNode
+from backend.core_nodes._json import JSON_START_CHARS, JSON_WHITESPACE, loads
+
+
+@lru_cache(maxsize=32)
+def _parse_schema(schema_str: str) -> Any:
+    """
+    Parse a JSON schema string.
+
+    A node's schema stays the same across executions, so parsed schemas are
+    cached. Callers must not modify the returned schema.
+    """
+    return loads(schema_str)
+
+
+@lru_cache(maxsize=32)
+def _schema_validator(schema_str: str) -> Any:
+    """
+    Build a jsonschema validator for a schema string.
+
+    The schema is checked once when the validator is built, so repeated
+    validations against the same schema skip that work.
+    """
+    import jsonschema
+    
+    schema = _parse_schema(schema_str)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
 
 class JsonParser(BaseNode):
     """
@@ -10,8 +40,9 @@ class JsonParser(BaseNode):
     This node can convert between JSON strings and JavaScript objects.
     """
     
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.json_parser",
             name="JSON Parser",
@@ -122,8 +153,6 @@ class JsonParser(BaseNode):
         
         # Get configuration
         operation = config.get("operation", "parse")
-        pretty_print = config.get("pretty_print", True)
-        indent = int(config.get("indent", 2)) if pretty_print else None
         schema_str = config.get("schema", "")
         
         # Initialize outputs
@@ -135,13 +164,22 @@ class JsonParser(BaseNode):
             if operation == "parse":
                 # Parse JSON string to object
                 if isinstance(input_value, str):
-                    output = json.loads(input_value)
-                    is_valid = True
+                    value_start = len(input_value) - len(input_value.lstrip(JSON_WHITESPACE))
+                    if (input_value[value_start:value_start + 1] in JSON_START_CHARS
+                            or input_value.startswith("\ufeff")):
+                        output = loads(input_value)
+                        is_valid = True
+                    else:
+                        # Nothing that can start a JSON value; report the error
+                        # json.loads would raise without raising it
+                        error = f"Invalid JSON: {json.JSONDecodeError('Expecting value', input_value, value_start)}"
                 else:
                     error = "Input must be a string for parse operation"
             
             elif operation == "stringify":
-                # Convert object to JSON string
+                # Convert object to JSON string; only this operation uses
+                # the formatting settings
+                indent = int(config.get("indent", 2)) if config.get("pretty_print", True) else None
                 output = json.dumps(input_value, indent=indent, ensure_ascii=False)
                 is_valid = True
             
@@ -152,11 +190,11 @@ class JsonParser(BaseNode):
                     
                     # Parse schema if provided
                     if schema_str:
-                        schema = json.loads(schema_str)
+                        schema = _parse_schema(schema_str)
                     else:
                         # If no schema provided, just validate that it's valid JSON
                         if isinstance(input_value, str):
-                            json.loads(input_value)
+                            loads(input_value)
                             is_valid = True
                             output = True
                         else:
@@ -168,12 +206,17 @@ class JsonParser(BaseNode):
                     
                     # Convert input to object if it's a string
                     if isinstance(input_value, str):
-                        input_obj = json.loads(input_value)
+                        input_obj = loads(input_value)
                     else:
                         input_obj = input_value
                     
-                    # Validate against schema
-                    jsonschema.validate(instance=input_obj, schema=schema)
+                    # Validate against schema, reporting the same error
+                    # jsonschema.validate would
+                    validation_error = jsonschema.exceptions.best_match(
+                        _schema_validator(schema_str).iter_errors(input_obj)
+                    )
+                    if validation_error is not None:
+                        raise validation_error
                     is_valid = True
                     output = True
                 
@@ -217,7 +260,7 @@ class JsonParser(BaseNode):
         schema_str = config.get("schema", "")
         if schema_str and operation == "validate":
             try:
-                json.loads(schema_str)
+                _parse_schema(schema_str)
             except json.JSONDecodeError as e:
                 return f"Invalid JSON Schema: {str(e)}"
         
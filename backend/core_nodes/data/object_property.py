@@ -1,6 +1,137 @@
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Any, Optional, Tuple
+import json
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 from backend.core_nodes.base_node import BaseNode
+from backend.core_nodes.data._json_config import config_value
+
+
+# A split property path: all of its parts, the parts leading to the
+# property and the property's own key
+_SplitPath = Tuple[Tuple[str, ...], Tuple[str, ...], str]
+
+
+@lru_cache(maxsize=256)
+def _split_path(property_path: str) -> _SplitPath:
+    """Split a dotted property path, so set and delete do not slice it per call."""
+    path_parts = tuple(property_path.split("."))
+    return path_parts, path_parts[:-1], path_parts[-1]
+
+
+# Marks a missing key, since None is a valid property value
+_MISSING = object()
+
+
+def _walk(obj: Any, path_parts: Tuple[str, ...]) -> Tuple[Any, bool]:
+    """Follow a property path, returning the value found and whether it exists."""
+    current = obj
+    for part in path_parts:
+        if not isinstance(current, dict):
+            return None, False
+        current = current.get(part, _MISSING)
+        if current is _MISSING:
+            return None, False
+    return current, True
+
+
+def _set_path(obj: Dict[str, Any], parent_parts: Tuple[str, ...], key: str, value: Any, create_path: bool) -> Optional[Dict[str, Any]]:
+    """
+    Return a copy of the object with a nested property set.
+
+    Only the dicts along the path are copied, so the rest of the tree is
+    shared with the original object. Returns None if the path does not lead
+    to an object and may not be created.
+    """
+    root = current = dict(obj)
+    for part in parent_parts:
+        child = current.get(part)
+        if isinstance(child, dict):
+            child = dict(child)
+        elif create_path:
+            child = {}
+        else:
+            return None
+        current[part] = child
+        current = child
+    current[key] = value
+    return root
+
+
+def _delete_path(obj: Dict[str, Any], parent_parts: Tuple[str, ...], key: str) -> Optional[Dict[str, Any]]:
+    """
+    Return a copy of the object with a nested property deleted.
+
+    Only the dicts along the path are copied, so the rest of the tree is
+    shared with the original object. Returns None without copying anything
+    if the property does not exist.
+    """
+    parent = _walk(obj, parent_parts)[0]
+    if not isinstance(parent, dict) or key not in parent:
+        return None
+    root = current = dict(obj)
+    for part in parent_parts:
+        child = dict(current[part])
+        current[part] = child
+        current = child
+    del current[key]
+    return root
+
+
+# Operation handlers take the object, the split path, the input value and
+# the config, and return the result, the modified object and whether the
+# property exists. The object itself is never modified; set and delete
+# return a copy when they change something
+
+def _op_get(obj: Dict[str, Any], path: _SplitPath, value: Any, config: Dict[str, Any]) -> Tuple[Any, Dict[str, Any], bool]:
+    """Get the property, or the default value if it does not exist."""
+    path_parts, parent_parts, key = path
+    if parent_parts:
+        result, exists = _walk(obj, path_parts)
+    else:
+        # A single key needs just one dict lookup
+        result = obj.get(key, _MISSING)
+        exists = result is not _MISSING
+    if not exists:
+        result = config_value(config.get("default_value", "null"))
+    return result, obj, exists
+
+
+def _op_set(obj: Dict[str, Any], path: _SplitPath, value: Any, config: Dict[str, Any]) -> Tuple[Any, Dict[str, Any], bool]:
+    """Set the property on a copy of the object."""
+    _, parent_parts, key = path
+    obj_copy = _set_path(obj, parent_parts, key, value, config.get("create_path", False))
+    if obj_copy is None:
+        return None, obj, False
+    return value, obj_copy, True
+
+
+def _op_delete(obj: Dict[str, Any], path: _SplitPath, value: Any, config: Dict[str, Any]) -> Tuple[Any, Dict[str, Any], bool]:
+    """Delete the property from a copy of the object, returning whether it existed."""
+    _, parent_parts, key = path
+    obj_copy = _delete_path(obj, parent_parts, key)
+    if obj_copy is None:
+        return False, obj, False
+    return True, obj_copy, False
+
+
+def _op_exists(obj: Dict[str, Any], path: _SplitPath, value: Any, config: Dict[str, Any]) -> Tuple[Any, Dict[str, Any], bool]:
+    """Check whether the property exists."""
+    path_parts, parent_parts, key = path
+    if parent_parts:
+        _, exists = _walk(obj, path_parts)
+    else:
+        exists = key in obj
+    return exists, obj, exists
+
+
+# Handler for each operation
+_OPERATIONS: Dict[str, Callable] = {
+    "get": _op_get,
+    "set": _op_set,
+    "delete": _op_delete,
+    "exists": _op_exists
+}
+
 
 class ObjectProperty(BaseNode):
     """
@@ -9,8 +140,9 @@ class ObjectProperty(BaseNode):
     This node can get, set, or delete properties of objects.
     """
     
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.object_property",
             name="Object Property",
@@ -137,115 +269,47 @@ class ObjectProperty(BaseNode):
         Returns:
             The result of the operation
         """
-        import json
-        import copy
-        
         # Get inputs
         obj = inputs.get("object")
-        value = inputs.get("value")
         input_property = inputs.get("property_name")
         
         # Get configuration
         operation = config.get("operation", "get")
         property_path = input_property or config.get("property", "")
-        default_value_str = config.get("default_value", "null")
-        create_path = config.get("create_path", False)
-        
-        # Parse default value
-        try:
-            default_value = json.loads(default_value_str)
-        except json.JSONDecodeError:
-            default_value = None
         
         # Check if object is valid
         if obj is None or not isinstance(obj, dict):
             return {
-                "result": default_value,
+                "result": config_value(config.get("default_value", "null")),
                 "modified_object": {},
                 "exists": False
             }
         
-        # Make a copy of the object to avoid modifying the original
-        obj_copy = copy.deepcopy(obj)
-        
         # Split property path
-        path_parts = property_path.split(".")
-        
-        # Function to get a nested property
-        def get_nested_property(obj, path_parts):
-            current = obj
-            for part in path_parts:
-                if not isinstance(current, dict) or part not in current:
-                    return None, False
-                current = current[part]
-            return current, True
-        
-        # Function to set a nested property
-        def set_nested_property(obj, path_parts, value, create_path):
-            current = obj
-            for i, part in enumerate(path_parts[:-1]):
-                if part not in current:
-                    if create_path:
-                        current[part] = {}
-                    else:
-                        return False
-                if not isinstance(current[part], dict):
-                    if create_path:
-                        current[part] = {}
-                    else:
-                        return False
-                current = current[part]
-            current[path_parts[-1]] = value
-            return True
-        
-        # Function to delete a nested property
-        def delete_nested_property(obj, path_parts):
-            current = obj
-            for i, part in enumerate(path_parts[:-1]):
-                if not isinstance(current, dict) or part not in current:
-                    return False
-                current = current[part]
-            if path_parts[-1] in current:
-                del current[path_parts[-1]]
-                return True
-            return False
+        path = _split_path(property_path)
         
         # Perform the operation
-        if operation == "get":
-            result, exists = get_nested_property(obj_copy, path_parts)
+        handler = _OPERATIONS.get(operation)
+        if handler is None:
             return {
-                "result": result if exists else default_value,
-                "modified_object": obj_copy,
-                "exists": exists
-            }
-        
-        elif operation == "set":
-            success = set_nested_property(obj_copy, path_parts, value, create_path)
-            result, exists = get_nested_property(obj_copy, path_parts)
-            return {
-                "result": result,
-                "modified_object": obj_copy,
-                "exists": exists
-            }
-        
-        elif operation == "delete":
-            success = delete_nested_property(obj_copy, path_parts)
-            return {
-                "result": success,
-                "modified_object": obj_copy,
+                "result": None,
+                "modified_object": obj,
                 "exists": False
             }
         
-        elif operation == "exists":
-            _, exists = get_nested_property(obj_copy, path_parts)
-            return {
-                "result": exists,
-                "modified_object": obj_copy,
-                "exists": exists
-            }
-        
+        result, modified_object, exists = handler(obj, path, inputs.get("value"), config)
         return {
-            "result": None,
-            "modified_object": obj_copy,
-            "exists": False
+            "result": result,
+            "modified_object": modified_object,
+            "exists": exists
         }
+    
+    def validate_config(self, config: Dict[str, Any]) -> Optional[str]:
+        """Validate the node configuration."""
+        default_value_str = config.get("default_value", "null")
+        try:
+            json.loads(default_value_str)
+        except json.JSONDecodeError as e:
+            return f"Invalid JSON in Default Value: {str(e)}"
+        
+        return None
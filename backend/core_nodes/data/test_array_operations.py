@@ -0,0 +1,50 @@
+"""
+Tests for the Array Operations node.
+"""
+
+from backend.core_nodes.data.array_operations import ArrayOperations
+
+
+def _unique(array):
+    """Run the unique operation on an array."""
+    return ArrayOperations().execute({"operation": "unique"}, {"array": array})
+
+
+def test_unique_keeps_first_occurrence_order():
+    """Duplicates are dropped and the remaining items keep their input order."""
+    assert _unique([3, 1, 3, 2, 1])["modified_array"] == [3, 1, 2]
+    assert _unique([2, 1, 3, 1, 2])["modified_array"] == [2, 1, 3]
+
+
+def test_unique_compares_dicts_and_lists_by_content():
+    """Unhashable items are deduplicated by content in input order."""
+    array = [{"a": 1, "b": 2}, [1, 2], {"b": 2, "a": 1}, [1, 2], {"a": 2}, [2, 1]]
+    outputs = _unique(array)
+
+    assert outputs["modified_array"] == [{"a": 1, "b": 2}, [1, 2], {"a": 2}, [2, 1]]
+    assert outputs["result"] == 4
+    assert outputs["length"] == 4
+    # The caller's array is left untouched
+    assert len(array) == 6
+
+
+def test_unique_falls_back_for_items_without_content_key():
+    """Items such as sets, which have no content key, are still deduplicated."""
+    array = [[{1}], "x", [{1}], "x", [{2}]]
+
+    assert _unique(array)["modified_array"] == [[{1}], "x", [{2}]]
+
+
+def test_sort_leaves_unorderable_array_unchanged():
+    """An array whose items can't be compared is returned as it was."""
+    outputs = ArrayOperations().execute({"operation": "sort"}, {"array": [2, "a", 1]})
+
+    assert outputs["modified_array"] == [2, "a", 1]
+
+
+def test_join_returns_empty_string_for_non_string_delimiter():
+    """A delimiter that isn't a string produces an empty result."""
+    node = ArrayOperations()
+
+    assert node.execute({"operation": "join", "join_delimiter": "-"}, {"array": [1, "b"]})["result"] == "1-b"
+    assert node.execute({"operation": "join", "join_delimiter": 5}, {"array": ["a", "b"]})["result"] == ""
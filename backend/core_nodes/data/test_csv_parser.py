@@ -0,0 +1,58 @@
+"""
+Tests for the CSV Parser node's parse operation.
+"""
+
+from backend.core_nodes.data.csv_parser import CsvParser
+
+
+def _parse(text, **config):
+    """Parse a CSV string with the given config."""
+    config["operation"] = "parse"
+    return CsvParser().execute(config, {"input": text})
+
+
+def test_parse_empty_input():
+    """Empty input parses to no rows and no headers."""
+    assert _parse("") == {"output": [], "headers": [], "error": None}
+    assert _parse("", has_header=False) == {"output": [], "headers": [], "error": None}
+
+
+def test_parse_header_only():
+    """A header row with no data gives its headers and no rows."""
+    assert _parse("a,b\n") == {"output": [], "headers": ["a", "b"], "error": None}
+
+
+def test_parse_custom_headers():
+    """Custom headers name the columns of every row when there is no header row."""
+    assert _parse("1,2,3\n4,5,6\n", has_header=False, custom_headers="x, y ,z") == {
+        "output": [{"x": "1", "y": "2", "z": "3"}, {"x": "4", "y": "5", "z": "6"}],
+        "headers": ["x", "y", "z"],
+        "error": None
+    }
+    # The first row is data, not a header
+    assert _parse("a,b\n", has_header=False, custom_headers="x,y")["output"] == [{"x": "a", "y": "b"}]
+    # A header row takes precedence over custom headers
+    assert _parse("a,b\n1,2\n", custom_headers="k,j") == {
+        "output": [{"a": "1", "b": "2"}],
+        "headers": ["a", "b"],
+        "error": None
+    }
+
+
+def test_parse_rows_shorter_or_longer_than_header():
+    """Short rows omit missing columns and values beyond the last header are dropped."""
+    assert _parse("a,b,c\n1,2\n3,4,5,6\n") == {
+        "output": [{"a": "1", "b": "2"}, {"a": "3", "b": "4", "c": "5"}],
+        "headers": ["a", "b", "c"],
+        "error": None
+    }
+    assert _parse("1,2\n3\n", has_header=False, custom_headers="x,y,z")["output"] == [{"x": "1", "y": "2"}, {"x": "3"}]
+
+
+def test_parse_without_headers_returns_arrays():
+    """Without any headers rows are returned as arrays, named after the first row's width."""
+    assert _parse("1,2\n3,4,5\n", has_header=False) == {
+        "output": [["1", "2"], ["3", "4", "5"]],
+        "headers": ["Column1", "Column2"],
+        "error": None
+    }
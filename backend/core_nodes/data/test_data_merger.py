@@ -0,0 +1,30 @@
+"""
+Tests for the Data Merger node.
+"""
+
+from backend.core_nodes.data.data_merger import DataMerger
+
+
+def test_union_merges_dicts_and_lists_by_content():
+    """Union over unhashable items succeeds instead of reporting them as unhashable."""
+    outputs = DataMerger().execute(
+        {"merge_mode": "union"},
+        {
+            "input1": [{"id": 1}, [1, 2]],
+            "input2": [{"id": 2}, {"id": 1}, [1, 2]]
+        }
+    )
+
+    assert outputs["error"] is None
+    assert outputs["output"] == [{"id": 1}, [1, 2], {"id": 2}]
+    assert outputs["count"] == 3
+
+
+def test_union_keeps_first_occurrence_order():
+    """Hashable items keep the order in which they first appear."""
+    outputs = DataMerger().execute(
+        {"merge_mode": "union"},
+        {"input1": [3, 1], "input2": [2, 3], "input3": 1}
+    )
+
+    assert outputs["output"] == [3, 1, 2]
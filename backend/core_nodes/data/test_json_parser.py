@@ -0,0 +1,48 @@
+"""
+Tests for the JSON Parser node.
+"""
+
+import json
+
+from backend.core_nodes.data.json_parser import JsonParser
+
+
+def _json_loads_error(text):
+    """Get the error message json.loads reports for a string."""
+    try:
+        json.loads(text)
+    except json.JSONDecodeError as e:
+        return f"Invalid JSON: {e}"
+    raise AssertionError(f"{text!r} is valid JSON")
+
+
+def test_parse_reports_json_loads_error_for_non_json_strings():
+    """Strings rejected without parsing get the error json.loads would report."""
+    node = JsonParser()
+
+    for text in ["", "   ", "abc", "\n\n  hello", "x\ny", "'quoted'", ")", " \t\r\n"]:
+        outputs = node.execute({"operation": "parse"}, {"input": text})
+        assert outputs["error"] == _json_loads_error(text)
+        assert outputs["output"] is None
+        assert outputs["is_valid"] is False
+
+
+def test_parse_reports_json_loads_error_for_invalid_json():
+    """Strings that start like JSON but are invalid report the json.loads error."""
+    node = JsonParser()
+
+    for text in ["{bad", "tru", "[1,", "-", "\ufeff{}", "1 2"]:
+        outputs = node.execute({"operation": "parse"}, {"input": text})
+        assert outputs["error"] == _json_loads_error(text)
+        assert outputs["is_valid"] is False
+
+
+def test_parse_valid_json():
+    """Valid JSON, including NaN, parses to the same value as json.loads."""
+    node = JsonParser()
+
+    for text in ['{"a": [1, 2.5, null]}', "  true", "-1", '"text"', "NaN"]:
+        outputs = node.execute({"operation": "parse"}, {"input": text})
+        assert outputs["error"] is None
+        assert outputs["is_valid"] is True
+        assert repr(outputs["output"]) == repr(json.loads(text))
@@ -0,0 +1,107 @@
+"""
+Tests for the Object Property node.
+"""
+
+from backend.core_nodes.data.object_property import ObjectProperty
+
+
+def _make_object():
+    """Build a nested object to run operations on."""
+    return {"a": {"b": 1, "c": {"d": 2}}, "e": [1, 2], "s": "text"}
+
+
+def _run(operation, property_path, obj, value=None, **config):
+    """Run an operation on an object with the given config."""
+    config.update(operation=operation, property=property_path)
+    return ObjectProperty().execute(config, {"object": obj, "value": value})
+
+
+def test_validate_config_accepts_valid_default_value():
+    """Any JSON document, or no default value at all, is accepted."""
+    node = ObjectProperty()
+
+    assert node.validate_config({}) is None
+    for default_value in ["null", "0", '"text"', '{"a": [1, 2]}', "[]"]:
+        assert node.validate_config({"default_value": default_value}) is None
+
+
+def test_validate_config_rejects_invalid_default_value():
+    """A default value that is not JSON is reported with the parse error."""
+    node = ObjectProperty()
+
+    for default_value in ["{bad", "", "text", "[1,"]:
+        error = node.validate_config({"default_value": default_value})
+        assert error is not None
+        assert error.startswith("Invalid JSON in Default Value: ")
+
+
+def test_set_leaves_input_unmodified():
+    """Set returns a changed copy and shares only the untouched subtrees."""
+    obj = _make_object()
+    outputs = _run("set", "a.c.d", obj, value=5)
+
+    assert outputs["result"] == 5
+    assert outputs["exists"] is True
+    assert outputs["modified_object"] == {"a": {"b": 1, "c": {"d": 5}}, "e": [1, 2], "s": "text"}
+    assert obj == _make_object()
+    # Dicts along the path are copied; everything else is shared
+    assert outputs["modified_object"]["a"] is not obj["a"]
+    assert outputs["modified_object"]["a"]["c"] is not obj["a"]["c"]
+    assert outputs["modified_object"]["e"] is obj["e"]
+
+
+def test_set_missing_path():
+    """Missing parents are created only with create_path."""
+    obj = _make_object()
+
+    outputs = _run("set", "x.y.z", obj, value=5)
+    assert outputs == {"result": None, "modified_object": _make_object(), "exists": False}
+
+    outputs = _run("set", "x.y.z", obj, value=5, create_path=True)
+    assert outputs["result"] == 5
+    assert outputs["modified_object"]["x"] == {"y": {"z": 5}}
+
+    # A non-object parent is replaced only with create_path
+    assert _run("set", "s.t", obj, value=5)["exists"] is False
+    assert _run("set", "s.t", obj, value=5, create_path=True)["modified_object"]["s"] == {"t": 5}
+    assert obj == _make_object()
+
+
+def test_delete_leaves_input_unmodified():
+    """Delete returns a copy without the property."""
+    obj = _make_object()
+    outputs = _run("delete", "a.c.d", obj)
+
+    assert outputs["result"] is True
+    assert outputs["exists"] is False
+    assert outputs["modified_object"] == {"a": {"b": 1, "c": {}}, "e": [1, 2], "s": "text"}
+    assert obj == _make_object()
+
+
+def test_delete_missing_key_returns_input_unchanged():
+    """Deleting a property that does not exist returns the input object itself."""
+    obj = _make_object()
+
+    for property_path in ["a.zz", "x.y", "s.t", "zz"]:
+        outputs = _run("delete", property_path, obj)
+        assert outputs["result"] is False
+        assert outputs["exists"] is False
+        assert outputs["modified_object"] is obj
+    assert obj == _make_object()
+
+
+def test_get_returns_value_or_default():
+    """Get returns the input's own value, or a fresh default when missing."""
+    obj = _make_object()
+
+    outputs = _run("get", "a.c", obj)
+    assert outputs["result"] is obj["a"]["c"]
+    assert outputs["exists"] is True
+    assert outputs["modified_object"] is obj
+
+    first = _run("get", "a.q", obj, default_value='{"k": 1}')
+    second = _run("get", "a.q", obj, default_value='{"k": 1}')
+    assert first["result"] == {"k": 1}
+    assert first["exists"] is False
+    # Each execution gets its own copy of the parsed default
+    assert first["result"] is not second["result"]
@@ -1,6 +1,9 @@
 from typing import Dict, Any, Optional
+import json
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 from backend.core_nodes.base_node import BaseNode
+from backend.core_nodes.data._json_config import config_value
+
 
 class Variable(BaseNode):
     """
@@ -9,8 +12,9 @@ class Variable(BaseNode):
     This node can store values and make them available to other nodes.
     """
     
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.variable",
             name="Variable",
@@ -116,55 +120,42 @@ class Variable(BaseNode):
         Returns:
             The variable value
         """
-        import json
-        
         # Get configuration
         var_name = config.get("name", "var")
         scope = config.get("scope", "workflow")
         initial_value_str = config.get("initial_value", "null")
         persist = config.get("persist", False)
         
-        # Parse initial value
-        try:
-            initial_value = json.loads(initial_value_str)
-        except json.JSONDecodeError:
-            initial_value = None
-        
         # Get workflow context
         context = inputs.get("__context__", {})
         
-        # Get variable storage based on scope
-        if scope == "global":
-            # Global variables are stored in a global context
-            var_storage = context.get("global_variables", {})
-        else:
-            # Workflow variables are stored in the workflow context
-            var_storage = context.get("workflow_variables", {})
+        # Get variable storage based on scope. Global variables are stored
+        # in a global context, workflow variables in the workflow context
+        storage_key = "global_variables" if scope == "global" else "workflow_variables"
+        var_storage = context.get(storage_key, {})
         
-        # Check if variable exists
         var_key = f"var_{var_name}"
-        is_set = var_key in var_storage
-        
-        # Get current value or use initial value
-        current_value = var_storage.get(var_key, initial_value)
         
         # Check if we should set a new value
         set_trigger = inputs.get("set", False)
         new_value = inputs.get("value")
         
         if set_trigger and new_value is not None:
-            # Update the value
-            current_value = new_value
-            is_set = True
-            
-            # Update the storage
-            var_storage[var_key] = current_value
+            # Update the storage, adding it to the context if it is new.
+            # Storage that came from the context is updated in place
+            var_storage[var_key] = new_value
+            context.setdefault(storage_key, var_storage)
             
-            # Update the context
-            if scope == "global":
-                context["global_variables"] = var_storage
-            else:
-                context["workflow_variables"] = var_storage
+            return {
+                "value": new_value,
+                "is_set": True,
+                "__context__": context
+            }
+        
+        # Otherwise only read the variable. The initial value is only
+        # parsed when the variable has not been set
+        is_set = var_key in var_storage
+        current_value = var_storage[var_key] if is_set else config_value(initial_value_str)
         
         return {
             "value": current_value,
@@ -6,10 +6,11 @@ functionality, error handling, and lifecycle management.
 """
 
 import time
+import asyncio
 import logging
 import inspect
 import traceback
-from typing import Dict, Any, Optional, List, Set, ClassVar, Type
+from typing import Dict, Any, Optional, List, Set, ClassVar, Tuple, Type
 from enum import Enum
 from datetime import datetime
 
@@ -29,9 +30,24 @@ class NodeLifecycleState(str, Enum):
     DISABLED = "disabled"
 
 
+def _datetime_from_ns(timestamp_ns: int) -> datetime:
+    """Convert a time.time_ns() value to a local datetime."""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
 class NodeExecutionResult:
     """Result of a node execution."""
     
+    __slots__ = (
+        "outputs",
+        "success",
+        "error_message",
+        "execution_time_ms",
+        "state",
+        "_timestamp_ns"
+    )
+    
     def __init__(
         self,
         outputs: Dict[str, Any],
@@ -46,7 +62,13 @@ class NodeExecutionResult:
         self.error_message = error_message
         self.execution_time_ms = execution_time_ms
         self.state = state
-        self.timestamp = datetime.now()
+        # Stored as an integer and only converted to a datetime when asked for
+        self._timestamp_ns = time.time_ns()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """When the result was created."""
+        return _datetime_from_ns(self._timestamp_ns)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -86,7 +108,7 @@ class EnhancedBaseNode:
         self._state = NodeLifecycleState.UNINITIALIZED
         self._error = None
         self._created_at = datetime.now()
-        self._last_executed = None
+        self._last_executed_ns = None
         
         # Performance metrics
         self._execution_count = 0
@@ -139,6 +161,24 @@ class EnhancedBaseNode:
         """
         raise NotImplementedError("Subclasses must implement execute()")
     
+    async def execute_async(self, config: Dict[str, Any], inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the node without blocking the event loop.
+        
+        By default this runs execute in the loop's default executor, so
+        independent nodes can run concurrently. Override this method for
+        nodes that can do their work natively with asyncio.
+        
+        Args:
+            config: The node configuration
+            inputs: The input values
+            
+        Returns:
+            The output values
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.execute, config, inputs)
+    
     def safe_execute(self, config: Dict[str, Any], inputs: Dict[str, Any]) -> NodeExecutionResult:
         """
         Safely execute the node with error handling and performance tracking.
@@ -150,54 +190,113 @@ class EnhancedBaseNode:
         Returns:
             The execution result
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            # Update state
-            self._state = NodeLifecycleState.RUNNING
-            self._last_executed = datetime.now()
-            
-            # Validate inputs and config
-            validated_inputs = self.validate_inputs(inputs)
-            validated_config = self.validate_config(config)
-            
-            # Execute the node
+            validated_config, validated_inputs = self._start_execution(config, inputs)
             outputs = self.execute(validated_config, validated_inputs)
+        except Exception as e:
+            return self._execution_failed(e, start_ns)
+        
+        return self._execution_succeeded(outputs, start_ns)
+    
+    async def safe_execute_async(self, config: Dict[str, Any], inputs: Dict[str, Any]) -> NodeExecutionResult:
+        """
+        Safely execute the node with execute_async, with error handling and
+        performance tracking.
+        
+        Args:
+            config: The node configuration
+            inputs: The input values
             
-            # Update state
-            self._state = NodeLifecycleState.COMPLETED
-            
-            # Update statistics
-            execution_time_ms = (time.time() - start_time) * 1000
-            self._update_statistics(execution_time_ms)
-            
-            return NodeExecutionResult(
-                outputs=outputs,
-                success=True,
-                execution_time_ms=execution_time_ms,
-                state=NodeLifecycleState.COMPLETED
-            )
+        Returns:
+            The execution result
+        """
+        start_ns = time.perf_counter_ns()
         
+        try:
+            validated_config, validated_inputs = self._start_execution(config, inputs)
+            outputs = await self.execute_async(validated_config, validated_inputs)
         except Exception as e:
-            # Update state
-            self._state = NodeLifecycleState.ERROR
-            self._error = str(e)
+            return self._execution_failed(e, start_ns)
+        
+        return self._execution_succeeded(outputs, start_ns)
+    
+    def _start_execution(self, config: Dict[str, Any], inputs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Mark the node as running and validate its config and inputs.
+        
+        Args:
+            config: The node configuration
+            inputs: The input values
             
-            # Update statistics
-            execution_time_ms = (time.time() - start_time) * 1000
-            self._update_statistics(execution_time_ms, error=True)
+        Returns:
+            The validated config and inputs
+        """
+        # Update state
+        self._state = NodeLifecycleState.RUNNING
+        self._last_executed_ns = time.time_ns()
+        
+        # Validate inputs and config
+        validated_inputs = self.validate_inputs(inputs)
+        validated_config = self.validate_config(config)
+        return validated_config, validated_inputs
+    
+    def _execution_succeeded(self, outputs: Dict[str, Any], start_ns: int) -> NodeExecutionResult:
+        """
+        Record a successful execution.
+        
+        Args:
+            outputs: The output values
+            start_ns: When the execution started, from time.perf_counter_ns()
             
-            # Log the error
-            logger.error(f"Error executing node {self.id}: {str(e)}")
-            logger.debug(traceback.format_exc())
+        Returns:
+            The execution result
+        """
+        # Update state
+        self._state = NodeLifecycleState.COMPLETED
+        
+        # Update statistics
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        self._update_statistics(execution_time_ms)
+        
+        return NodeExecutionResult(
+            outputs=outputs,
+            success=True,
+            execution_time_ms=execution_time_ms,
+            state=NodeLifecycleState.COMPLETED
+        )
+    
+    def _execution_failed(self, e: Exception, start_ns: int) -> NodeExecutionResult:
+        """
+        Record a failed execution.
+        
+        Args:
+            e: The exception raised by the execution
+            start_ns: When the execution started, from time.perf_counter_ns()
             
-            return NodeExecutionResult(
-                outputs={},
-                success=False,
-                error_message=str(e),
-                execution_time_ms=execution_time_ms,
-                state=NodeLifecycleState.ERROR
-            )
+        Returns:
+            The execution result
+        """
+        # Update state
+        self._state = NodeLifecycleState.ERROR
+        self._error = str(e)
+        
+        # Update statistics
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        self._update_statistics(execution_time_ms, error=True)
+        
+        # Log the error
+        logger.error(f"Error executing node {self.id}: {str(e)}")
+        logger.debug(traceback.format_exc())
+        
+        return NodeExecutionResult(
+            outputs={},
+            success=False,
+            error_message=str(e),
+            execution_time_ms=execution_time_ms,
+            state=NodeLifecycleState.ERROR
+        )
     
     def validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -265,13 +364,13 @@ class EnhancedBaseNode:
         inputs = []
         outputs = []
         
-        # Get execute method signature
+        # Get execute method signature and docstring
         sig = inspect.signature(self.execute)
+        doc = inspect.getdoc(self.execute) or ""
         
         # Check for inputs parameter
         if "inputs" in sig.parameters:
             # Try to get input annotations from docstring
-            doc = inspect.getdoc(self.execute) or ""
             input_types = self._parse_docstring_params(doc, "inputs")
             
             # Add a generic input if no specific inputs found
@@ -295,7 +394,6 @@ class EnhancedBaseNode:
                     ))
         
         # Try to get output annotations from docstring
-        doc = inspect.getdoc(self.execute) or ""
         output_types = self._parse_docstring_params(doc, "returns")
         
         # Add a generic output if no specific outputs found
@@ -410,14 +508,12 @@ class EnhancedBaseNode:
         """
         self._execution_count += 1
         
-        # Update average execution time using weighted average
-        if self._execution_count > 1:
-            self._average_execution_time_ms = (
-                (self._average_execution_time_ms * (self._execution_count - 1) + execution_time_ms) / 
-                self._execution_count
-            )
-        else:
-            self._average_execution_time_ms = execution_time_ms
+        # Update average execution time incrementally, which avoids scaling
+        # the average back up to a growing total; the first execution sets
+        # it to execution_time_ms
+        self._average_execution_time_ms += (
+            (execution_time_ms - self._average_execution_time_ms) / self._execution_count
+        )
         
         # Update error count
         if error:
@@ -435,7 +531,7 @@ class EnhancedBaseNode:
             "average_execution_time_ms": self._average_execution_time_ms,
             "error_count": self._error_count,
             "created_at": self._created_at.isoformat(),
-            "last_executed": self._last_executed.isoformat() if self._last_executed else None,
+            "last_executed": _datetime_from_ns(self._last_executed_ns).isoformat() if self._last_executed_ns else None,
             "state": self._state
         }
     
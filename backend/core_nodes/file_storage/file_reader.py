@@ -1,10 +1,71 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 import os
 import json
 import csv
 import io
+import codecs
+import base64
 from backend.app.models.plugin_metadata import PluginMetadata, PortDefinition, ConfigField, NodeCategory
 from backend.core_nodes.base_node import BaseNode
+from backend.core_nodes._json import orjson
+
+
+# File type used for each extension when the file type is auto-detected;
+# any other extension is read as binary
+_EXTENSION_FILE_TYPES = {
+    ".json": "json",
+    ".csv": "csv",
+    ".txt": "text",
+    ".md": "text",
+    ".py": "text",
+    ".js": "text",
+    ".html": "text",
+    ".css": "text"
+}
+
+
+def _read_json(full_path: str, encoding: str) -> Any:
+    """
+    Read a JSON file.
+    
+    UTF-8 files are parsed straight from their bytes with orjson when it is
+    installed. Anything orjson rejects, such as NaN, is parsed again with
+    the json module, which also raises the error reported for invalid files.
+    """
+    if orjson is not None and codecs.lookup(encoding).name == "utf-8":
+        with open(full_path, "rb") as f:
+            raw = f.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return json.loads(raw.decode(encoding))
+    
+    with open(full_path, "r", encoding=encoding) as f:
+        return json.load(f)
+
+
+def _iter_csv(full_path: str, encoding: str, delimiter: str, has_header: bool) -> Iterator[Any]:
+    """
+    Read the rows of a CSV file one at a time.
+    
+    The file is opened right away, so errors opening it are raised here
+    rather than when the rows are consumed. It then stays open until the
+    rows are exhausted or the iterator is closed, so only one row is held
+    in memory at a time.
+    """
+    f = open(full_path, "r", encoding=encoding, newline="")
+    return _iter_csv_rows(f, delimiter, has_header)
+
+
+def _iter_csv_rows(f: Any, delimiter: str, has_header: bool) -> Iterator[Any]:
+    """Yield the rows of an open CSV file, closing it when done."""
+    with f:
+        if has_header:
+            reader = csv.DictReader(f, delimiter=delimiter)
+        else:
+            reader = csv.reader(f, delimiter=delimiter)
+        yield from reader
+
 
 class FileReader(BaseNode):
     """
@@ -13,8 +74,9 @@ class FileReader(BaseNode):
     This node can read data from various file formats.
     """
     
-    def get_metadata(self) -> PluginMetadata:
-        """Get the node metadata."""
+    @classmethod
+    def _build_metadata(cls) -> PluginMetadata:
+        """Build the node metadata."""
         return PluginMetadata(
             id="core.file_reader",
             name="File Reader",
@@ -124,6 +186,26 @@ class FileReader(BaseNode):
                     required=False,
                     default_value=True
                 ),
+                ConfigField(
+                    id="streaming",
+                    name="Stream CSV Rows",
+                    type="boolean",
+                    description="Return CSV rows as an iterator that reads the file as it is consumed, instead of a list. In-process use only: the iterator is not JSON-serializable, and decoding errors are raised while it is consumed instead of being returned in Error",
+                    required=False,
+                    default_value=False
+                ),
+                ConfigField(
+                    id="binary_encoding",
+                    name="Binary Encoding",
+                    type="select",
+                    description="How binary file contents are returned. Raw bytes are only usable within the same process, as they are not JSON-serializable",
+                    required=False,
+                    default_value="base64",
+                    options=[
+                        {"label": "Base64 String", "value": "base64"},
+                        {"label": "Raw Bytes", "value": "raw"}
+                    ]
+                ),
                 ConfigField(
                     id="max_size",
                     name="Max Size (KB)",
@@ -169,6 +251,8 @@ class FileReader(BaseNode):
         config_encoding = config.get("encoding", "utf-8")
         csv_delimiter = config.get("csv_delimiter", ",")
         csv_has_header = config.get("csv_has_header", True)
+        streaming = config.get("streaming", False)
+        binary_encoding = config.get("binary_encoding", "base64")
         max_size = int(config.get("max_size", 1024)) * 1024  # Convert to bytes
         base_path = config.get("base_path", "")
         
@@ -192,18 +276,21 @@ class FileReader(BaseNode):
             full_path = file_path
         
         try:
-            # Check if file exists
-            if not os.path.exists(full_path):
+            # Check if file exists. A single stat call also provides the
+            # file info; like os.path.exists, any failure means not found
+            try:
+                file_stat = os.stat(full_path)
+            except (OSError, ValueError):
                 error = f"File not found: {full_path}"
                 return {"data": None, "file_info": {}, "error": error}
             
             # Get file info
-            file_size = os.path.getsize(full_path)
+            file_size = file_stat.st_size
             file_info = {
                 "path": full_path,
                 "size": file_size,
                 "size_kb": round(file_size / 1024, 2),
-                "modified": os.path.getmtime(full_path),
+                "modified": file_stat.st_mtime,
                 "extension": os.path.splitext(full_path)[1].lower()
             }
             
@@ -214,15 +301,7 @@ class FileReader(BaseNode):
             
             # Auto-detect file type if needed
             if file_type == "auto":
-                extension = file_info["extension"]
-                if extension == ".json":
-                    file_type = "json"
-                elif extension == ".csv":
-                    file_type = "csv"
-                elif extension in [".txt", ".md", ".py", ".js", ".html", ".css"]:
-                    file_type = "text"
-                else:
-                    file_type = "binary"
+                file_type = _EXTENSION_FILE_TYPES.get(file_info["extension"], "binary")
             
             # Read file based on type
             if file_type == "text":
@@ -230,24 +309,20 @@ class FileReader(BaseNode):
                     data = f.read()
             
             elif file_type == "json":
-                with open(full_path, "r", encoding=encoding) as f:
-                    data = json.load(f)
+                data = _read_json(full_path, encoding)
             
             elif file_type == "csv":
-                with open(full_path, "r", encoding=encoding, newline="") as f:
-                    if csv_has_header:
-                        reader = csv.DictReader(f, delimiter=csv_delimiter)
-                        data = list(reader)
-                    else:
-                        reader = csv.reader(f, delimiter=csv_delimiter)
-                        data = list(reader)
+                data = _iter_csv(full_path, encoding, csv_delimiter, csv_has_header)
+                if not streaming:
+                    data = list(data)
             
             elif file_type == "binary":
                 with open(full_path, "rb") as f:
-                    binary_data = f.read()
-                    # Convert to base64 for safe handling
-                    import base64
-                    data = base64.b64encode(binary_data).decode("ascii")
+                    data = f.read()
+                # Convert to base64 for safe handling, unless the consumer
+                # asked for the bytes themselves
+                if binary_encoding != "raw":
+                    data = base64.b64encode(data).decode("ascii")
             
             # Update file info
             file_info["type"] = file_type
@@ -282,4 +357,8 @@ class FileReader(BaseNode):
         if file_type == "csv" and not csv_delimiter:
             return "CSV delimiter cannot be empty"
         
+        # Streaming only applies to CSV files
+        if config.get("streaming", False) and file_type not in ("csv", "auto"):
+            return "Streaming is only supported for CSV files"
+        
         return None
@@ -0,0 +1,62 @@
+"""
+Tests for the File Reader node.
+"""
+
+from backend.core_nodes.file_storage.file_reader import FileReader
+
+
+CSV_CONTENT = "name,age\nada,36\nalan,41\n"
+
+
+def test_streaming_csv_yields_same_rows_as_list(tmp_path):
+    """Streaming returns an iterator over the rows the list mode returns."""
+    csv_path = tmp_path / "people.csv"
+    csv_path.write_text(CSV_CONTENT, encoding="utf-8")
+    node = FileReader()
+
+    listed = node.execute({"file_type": "csv"}, {"file_path": str(csv_path)})
+    streamed = node.execute({"file_type": "csv", "streaming": True}, {"file_path": str(csv_path)})
+
+    assert isinstance(listed["data"], list)
+    assert not isinstance(streamed["data"], list)
+    assert streamed["error"] is None
+    assert list(streamed["data"]) == listed["data"] == [
+        {"name": "ada", "age": "36"},
+        {"name": "alan", "age": "41"}
+    ]
+
+
+def test_streaming_csv_reports_open_errors(tmp_path):
+    """Errors opening the file are returned in error, not raised while iterating."""
+    outputs = FileReader().execute(
+        {"file_type": "csv", "streaming": True},
+        {"file_path": str(tmp_path)}
+    )
+
+    assert outputs["data"] is None
+    assert outputs["error"]
+
+
+def test_validate_config_rejects_streaming_for_non_csv_files():
+    """Streaming is only accepted where the file can be read as CSV."""
+    node = FileReader()
+
+    assert node.validate_config({"file_type": "csv", "streaming": True}) is None
+    assert node.validate_config({"file_type": "auto", "streaming": True}) is None
+    assert node.validate_config({"file_type": "json", "streaming": True}) == "Streaming is only supported for CSV files"
+    assert node.validate_config({"file_type": "json", "streaming": False}) is None
+
+
+def test_binary_file_is_base64_by_default_and_bytes_when_raw(tmp_path):
+    """Binary contents are a base64 string unless raw bytes are requested."""
+    binary_path = tmp_path / "image.png"
+    binary_path.write_bytes(b"\x89PNG\x00\xff")
+    node = FileReader()
+
+    encoded = node.execute({"file_type": "auto"}, {"file_path": str(binary_path)})
+    raw = node.execute({"file_type": "auto", "binary_encoding": "raw"}, {"file_path": str(binary_path)})
+
+    assert encoded["data"] == "iVBORwD/"
+    assert raw["data"] == b"\x89PNG\x00\xff"
+    assert raw["file_info"]["type"] == "binary"
+    assert raw["error"] is None
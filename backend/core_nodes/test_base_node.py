@@ -0,0 +1,29 @@
+"""
+Tests for the base node's metadata handling.
+"""
+
+from backend.core_nodes.converters.number_converter import NumberConverter
+
+
+def test_metadata_is_kept_per_instance():
+    """An instance returns the same metadata object every time."""
+    node = NumberConverter()
+
+    assert node.get_metadata() is node.get_metadata()
+    assert node.get_metadata() is node.__plugin_meta__
+
+
+def test_metadata_changes_do_not_leak_between_instances():
+    """Editing one instance's metadata leaves other instances untouched."""
+    first = NumberConverter()
+    second = NumberConverter()
+    original_description = second.get_metadata().description
+
+    metadata = first.get_metadata()
+    metadata.description = "Edited description"
+    metadata.tags.append("edited")
+
+    assert first.get_metadata().description == "Edited description"
+    assert second.get_metadata().description == original_description
+    assert "edited" not in second.get_metadata().tags
+    assert "edited" not in NumberConverter().get_metadata().tags
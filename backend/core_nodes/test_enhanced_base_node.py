@@ -0,0 +1,92 @@
+"""
+Tests for the enhanced base node's async execution.
+"""
+
+import asyncio
+import threading
+import time
+
+from backend.core_nodes.enhanced_base_node import EnhancedBaseNode, NodeLifecycleState
+
+
+class _SleepNode(EnhancedBaseNode):
+    """Node that sleeps for the requested time, then fails if asked to."""
+
+    def execute(self, config, inputs):
+        barrier = inputs.get("barrier")
+        if barrier is not None:
+            barrier.wait()
+        time.sleep(inputs.get("delay", 0))
+        if inputs.get("fail"):
+            raise ValueError("requested failure")
+        return {"slept": inputs.get("delay", 0)}
+
+
+def test_execute_async_returns_execute_outputs():
+    """execute_async runs execute and returns its outputs."""
+    outputs = asyncio.run(_SleepNode().execute_async({}, {"delay": 0}))
+
+    assert outputs == {"slept": 0}
+
+
+def test_safe_execute_async_success():
+    """A successful execution returns the outputs and completes the node."""
+    node = _SleepNode()
+    result = asyncio.run(node.safe_execute_async({}, {"delay": 0.01}))
+
+    assert result.success
+    assert result.outputs == {"slept": 0.01}
+    assert result.error_message is None
+    assert result.state == NodeLifecycleState.COMPLETED
+    assert result.execution_time_ms >= 10
+    assert node.get_state() == NodeLifecycleState.COMPLETED
+
+
+def test_safe_execute_async_failure():
+    """An exception from execute is returned as a failed result."""
+    node = _SleepNode()
+    result = asyncio.run(node.safe_execute_async({}, {"fail": True}))
+
+    assert not result.success
+    assert result.outputs == {}
+    assert result.error_message == "requested failure"
+    assert result.state == NodeLifecycleState.ERROR
+    assert node.get_state() == NodeLifecycleState.ERROR
+    assert node.get_error() == "requested failure"
+
+
+def test_safe_execute_async_updates_statistics():
+    """Async executions are counted and timed like synchronous ones."""
+    node = _SleepNode()
+
+    async def run():
+        results = [await node.safe_execute_async({}, {"delay": 0.01})]
+        results.append(await node.safe_execute_async({}, {"fail": True}))
+        results.append(node.safe_execute({}, {"delay": 0.02}))
+        return results
+
+    results = asyncio.run(run())
+    statistics = node.get_statistics()
+
+    assert statistics["execution_count"] == 3
+    assert statistics["error_count"] == 1
+    assert statistics["last_executed"] is not None
+    expected_average = sum(result.execution_time_ms for result in results) / 3
+    assert abs(statistics["average_execution_time_ms"] - expected_average) < 1e-6
+
+
+def test_safe_execute_async_runs_nodes_concurrently():
+    """Independent nodes run in the executor without blocking each other."""
+    # Every execution waits until all four are running at once, so the
+    # barrier breaks if the executions are serialized
+    barrier = threading.Barrier(4, timeout=10)
+
+    async def run():
+        return await asyncio.gather(*(
+            _SleepNode().safe_execute_async({}, {"barrier": barrier}) for _ in range(4)
+        ))
+
+    results = asyncio.run(run())
+
+    assert [result.error_message for result in results] == [None] * 4
+    assert not barrier.broken